@@ -3,12 +3,11 @@ import os
 from http import HTTPStatus
 from typing import Any, Dict, Optional
 
-import boto3
 import requests
 from aws_lambda_powertools import Logger
 
 from src.shared.settings import settings
-from src.shared.utils import response
+from src.shared.utils import get_boto_client, response
 
 # Configure basic logging
 logger = Logger(service='city-collector')
@@ -60,7 +59,7 @@ def city_collector(event, context):
 
         # Step 2: Queue scraping task for the city/state
         region = os.environ.get('AWS_REGION_NAME', settings.region)
-        sqs_client = boto3.client('sqs', region_name=region)
+        sqs_client = get_boto_client('sqs', region)
         sqs_response = sqs_client.send_message(
             QueueUrl=os.environ.get('SCRAPER_TASK_QUEUE_URL'),
             MessageBody=json.dumps(
@@ -19,7 +19,7 @@ from auris_tools.databaseHandlers import DatabaseHandler
 from aws_lambda_powertools import Logger
 
 from src.shared.settings import Settings
-from src.shared.utils import calculate_similarity_ratio, response
+from src.shared.utils import calculate_similarity_ratios, response
 
 logger = Logger(service='add_new_company')
 settings = Settings()
@@ -237,15 +237,21 @@ def check_duplicate_company(
 
         logger.info(f'Found {len(result)} existing companies to check for duplicates')
 
+        # Compare the name against every existing company in one batch
+        existing_names = [company['name'] for company in result if company.get('name')]
+        similarities = calculate_similarity_ratios(
+            name, existing_names, min_ratio=SIMILARITY_THRESHOLD
+        )
+
         # Check each company for name similarity
-        for company in result:
-            existing_name = company.get('name', '')
-            if not existing_name:
+        for existing_name, similarity in zip(existing_names, similarities):
+            if similarity is None:
+                logger.debug(
+                    f"Comparing '{name}' with '{existing_name}': "
+                    'ruled out by length difference'
+                )
                 continue
 
-            # Calculate similarity ratio (normalized)
-            similarity = calculate_similarity_ratio(name, existing_name)
-
             logger.debug(
                 f"Comparing '{name}' with '{existing_name}': {similarity}% similarity"
             )
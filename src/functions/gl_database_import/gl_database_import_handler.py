@@ -22,19 +22,25 @@ import os
 import re
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import boto3
 import pandas as pd
 from auris_tools.databaseHandlers import DatabaseHandler
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
 from src.shared.settings import Settings
-from src.shared.utils import normalize_phone, response
+from src.shared.utils import (
+    LEADS_PHONE_INDEX,
+    LEADS_PHONE_KEY_CONDITION,
+    get_boto_client,
+    normalize_phone,
+    response,
+)
 
 logger = Logger(service='gl-database-import')
 settings = Settings()
@@ -50,6 +56,7 @@ PRESIGNED_URL_EXPIRATION = 3600  # 1 hour
 BATCH_SIZE = 10  # Messages per SQS batch (max 10)
 BATCH_UPDATE_INTERVAL = 3  # Update status every N batches
 TIMEOUT_MINUTES = 3  # Mark as timeout after this duration
+DUPLICATE_CHECK_MAX_WORKERS = 10  # Concurrent GSI queries (botocore pool size)
 
 # Required CSV columns (exact match)
 REQUIRED_COLUMNS = ['fullName', 'phone', 'source', 'entryDate']
@@ -273,7 +280,7 @@ def generate_presigned_upload_url(
         logger.info(f'Registro de importação criado: {import_id}')
 
         # Generate pre-signed POST URL
-        s3_client = boto3.client('s3', region_name=settings.region)
+        s3_client = get_boto_client('s3', settings.region)
 
         presigned_post = s3_client.generate_presigned_post(
             Bucket=UPLOAD_BUCKET,
@@ -356,7 +363,7 @@ def database_import_orchestrator(event: Dict[str, Any], context: Any) -> Dict[st
     Returns:
         Success/failure status with import summary
     """
-    s3_client = boto3.client('s3', region_name=settings.region)
+    s3_client = get_boto_client('s3', settings.region)
     import_db = DatabaseHandler(table_name=settings.import_status_table_name)
 
     import_id = None
@@ -687,7 +694,7 @@ def _filter_duplicate_leads(
 
     Process:
     1. Extract all normalized phone numbers from validated DataFrame
-    2. Query DynamoDB GSI for each unique phone
+    2. Query DynamoDB GSI for each unique phone (concurrently)
     3. Build set of duplicate phones
     4. Mark duplicate rows in complete DataFrame
     5. Filter to keep only non-duplicates
@@ -717,37 +724,15 @@ def _filter_duplicate_leads(
     # Initialize leads database handler
     leads_db = DatabaseHandler(table_name=settings.leads_table_name)
 
-    # Query for duplicates
-    duplicate_phones = set()
-
-    for phone in unique_phones:
-        try:
-            # Query GSI using boto3 client
-            response = leads_db.client.query(
-                TableName=settings.leads_table_name,
-                IndexName='companyID-phone-index',
-                KeyConditionExpression='companyID = :cid AND phone = :phone',
-                ExpressionAttributeValues={
-                    ':cid': {'S': company_id},
-                    ':phone': {'S': phone},
-                },
-            )
-
-            # Deserialize items from DynamoDB format
-            results_raw = response.get('Items', [])
-            results = (
-                [leads_db._deserialize_item(item) for item in results_raw]
-                if results_raw
-                else []
-            )
-
-            if results and len(results) > 0:
-                duplicate_phones.add(phone)
-                logger.debug(f'Duplicata encontrada: {phone}')
-
-        except Exception as e:
-            logger.warning(f'Erro ao consultar telefone {phone}: {str(e)}')
-            # Continue with other phones
+    # Query for duplicates; each phone is one GSI lookup, so run them
+    # concurrently instead of paying one round-trip after another
+    with ThreadPoolExecutor(max_workers=DUPLICATE_CHECK_MAX_WORKERS) as executor:
+        found = executor.map(
+            lambda phone: _phone_exists(leads_db, company_id, phone), unique_phones
+        )
+        duplicate_phones = {
+            phone for phone, exists in zip(unique_phones, found) if exists
+        }
 
     logger.info(f'Duplicatas encontradas: {len(duplicate_phones)}')
 
@@ -763,6 +748,42 @@ def _filter_duplicate_leads(
     return filtered_df, duplicate_count
 
 
+def _phone_exists(leads_db: DatabaseHandler, company_id: str, phone: str) -> bool:
+    """
+    Check whether a lead with the phone already exists for the company.
+
+    Args:
+        leads_db: DatabaseHandler for the leads table
+        company_id: Company identifier for scoped duplicate check
+        phone: Normalized phone number
+
+    Returns:
+        True if a lead exists; False otherwise, including on query errors
+    """
+    try:
+        # Query GSI using boto3 client; only the count is needed
+        response = leads_db.client.query(
+            TableName=settings.leads_table_name,
+            IndexName=LEADS_PHONE_INDEX,
+            KeyConditionExpression=LEADS_PHONE_KEY_CONDITION,
+            ExpressionAttributeValues={
+                ':company_id': {'S': company_id},
+                ':phone': {'S': phone},
+            },
+            Select='COUNT',
+        )
+
+        if response.get('Count', 0) > 0:
+            logger.debug(f'Duplicata encontrada: {phone}')
+            return True
+        return False
+
+    except Exception as e:
+        logger.warning(f'Erro ao consultar telefone {phone}: {str(e)}')
+        # Continue with other phones
+        return False
+
+
 def _process_leads_async(
     df: pd.DataFrame,
     company_id: str,
@@ -801,7 +822,7 @@ def _process_leads_async(
         return 0, 0
 
     # Initialize SQS client
-    sqs_client = boto3.client('sqs', region_name=settings.region)
+    sqs_client = get_boto_client('sqs', settings.region)
     queue_url = settings.operations_queue_url
 
     if not queue_url:
@@ -1196,7 +1217,7 @@ def get_import_status(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             and 'resultsFileKey' in import_record
         ):
             try:
-                s3_client = boto3.client('s3', region_name=settings.region)
+                s3_client = get_boto_client('s3', settings.region)
                 results_url = s3_client.generate_presigned_url(
                     'get_object',
                     Params={
@@ -3,11 +3,10 @@ import os
 from http import HTTPStatus
 from typing import Any, Dict, Optional
 
-import boto3
 from aws_lambda_powertools import Logger
 
 from src.shared.settings import settings
-from src.shared.utils import response
+from src.shared.utils import get_boto_client, response
 
 # Configure basic logging
 logger = Logger(service='gl-queue-manager')
@@ -112,7 +111,7 @@ def gl_queue_manager(event, context):
 
         # Prepare Lambda invocation payload with enriched metadata
         region = os.environ.get('AWS_REGION_NAME', settings.region)
-        lambda_client = boto3.client('lambda', region_name=region)
+        lambda_client = get_boto_client('lambda', region)
 
         logger.info(
             f'Invoking Lambda function {target_function_name} for operation {operation_type} '
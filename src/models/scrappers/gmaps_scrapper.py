@@ -1,10 +1,14 @@
+import hashlib
 import json
 import math
 import os
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import boto3
 import requests
@@ -12,6 +16,7 @@ from aws_lambda_powertools import Logger
 
 from src.models.scrappers import BaseScrapper
 from src.shared.settings import settings
+from src.shared.utils import get_boto_client
 
 try:
     from auris_tools.databaseHandlers import DatabaseHandler
@@ -29,13 +34,67 @@ COMPANY_SCHEMA_PATH = (
 with open(COMPANY_SCHEMA_PATH, 'r') as f:
     COMPANY_SCHEMA = json.load(f)
 
+# Load search terms per niche once per container instead of per scrapper
+NICHE_TERMS_PATH = Path(__file__).parent / 'niche_terms.json'
+with open(NICHE_TERMS_PATH, 'r', encoding='utf-8') as f:
+    NICHE_TERMS = json.load(f)
+
 # Google Places API (New) constants
 PLACES_TEXT_SEARCH_URL = 'https://places.googleapis.com/v1/places:searchText'
 PLACES_DETAILS_URL = 'https://places.googleapis.com/v1/places'
 # New API pricing (approximate - verify with Google's current pricing)
 TEXT_SEARCH_QUOTA_COST = 32  # Text Search (New) Basic
 PLACE_DETAILS_QUOTA_COST = 17  # Place Details Basic
+EARTH_RADIUS_METERS = 6371000
 DUPLICATE_DISTANCE_THRESHOLD_METERS = 50
+# Haversine term `a` at the duplicate threshold, so candidates can be compared
+# without the sqrt/atan2 needed to turn `a` into a distance
+DUPLICATE_HAVERSINE_THRESHOLD = (
+    math.sin(DUPLICATE_DISTANCE_THRESHOLD_METERS / (2 * EARTH_RADIUS_METERS)) ** 2
+)
+# Grid cell size for the duplicate index. 0.001 degrees is ~111m of latitude
+# and stays above the 50m threshold in longitude up to ~63 degrees of latitude,
+# so any duplicate is always within the 3x3 cells around a new place.
+DUPLICATE_GRID_CELL_DEGREES = 0.001
+PAGE_TOKEN_DELAY_SECONDS = 2
+DETAILS_MAX_WORKERS = 8  # Concurrent Place Details requests per search term
+# Statuses that make further search terms pointless for the current run
+STOP_COLLECTION_STATUSES = ('partial_quota_exceeded', 'failed_api_error')
+# Legacy fields only returned by Place Details, reused for places already stored
+DETAIL_ONLY_FIELDS = ('reviews',)
+TEXT_SEARCH_FIELD_MASK = (
+    'places.id,places.displayName,places.formattedAddress,'
+    'places.location,places.rating,places.userRatingCount,'
+    'places.businessStatus,places.types,places.photos,'
+    'places.currentOpeningHours,places.nationalPhoneNumber,'
+    'places.internationalPhoneNumber,places.websiteUri,'
+    'places.googleMapsUri,places.priceLevel,nextPageToken'
+)
+PLACE_DETAILS_FIELD_MASK = (
+    'id,displayName,formattedAddress,location,rating,'
+    'userRatingCount,nationalPhoneNumber,internationalPhoneNumber,'
+    'websiteUri,googleMapsUri,currentOpeningHours,regularOpeningHours,'
+    'businessStatus,types,photos,reviews,priceLevel'
+)
+
+# New API fields copied verbatim to their legacy names.
+# Fields that need reshaping (name, location, opening hours) are handled
+# explicitly in `_convert_place_to_legacy_format`.
+LEGACY_FIELD_MAP = (
+    ('id', 'id'),
+    ('formattedAddress', 'formatted_address'),
+    ('rating', 'rating'),
+    ('userRatingCount', 'user_ratings_total'),
+    ('nationalPhoneNumber', 'formatted_phone_number'),
+    ('internationalPhoneNumber', 'international_phone_number'),
+    ('websiteUri', 'website'),
+    ('googleMapsUri', 'url'),
+    ('businessStatus', 'business_status'),
+    ('types', 'types'),
+    ('photos', 'photos'),
+    ('reviews', 'reviews'),
+    ('priceLevel', 'price_level'),
+)
 
 
 class GMapsScrapper(BaseScrapper):
@@ -47,9 +106,20 @@ class GMapsScrapper(BaseScrapper):
         niche (str): The business niche (e.g., 'aasi', 'orl', 'geria', 'audiologist')
         api_key (str): Google Places API key
         daily_quota_limit (int): Daily API quota limit (default: 20000)
+        fetch_details (bool): Enrich results with Place Details
+            (default: settings.google_places_fetch_details)
+        force_rescan (bool): Fetch details even for places already stored
+            in the places table (default: False)
     """
 
-    def __init__(self, niche: str, api_key: str, daily_quota_limit: int = 20000):
+    def __init__(
+        self,
+        niche: str,
+        api_key: str,
+        daily_quota_limit: int = 20000,
+        fetch_details: Optional[bool] = None,
+        force_rescan: bool = False,
+    ):
         """Initialize the GMapsScrapper with niche and API credentials."""
         super().__init__()
 
@@ -62,6 +132,20 @@ class GMapsScrapper(BaseScrapper):
         self.api_key = api_key
         self.daily_quota_limit = daily_quota_limit
         self.quota_used = 0
+        self._quota_lock = threading.Lock()
+        self.fetch_details = (
+            settings.google_places_fetch_details
+            if fetch_details is None
+            else fetch_details
+        )
+        self.force_rescan = force_rescan
+        self._existing_places: Dict[str, Optional[Dict]] = {}
+        # Grid cell -> (lat_rad, lng_rad, cos_lat, place) for every collected
+        # place with coordinates, kept alongside ensamble['places'] so
+        # duplicate checks only look at nearby places
+        self._coord_grid: Dict[
+            Tuple[int, int], List[Tuple[float, float, float, Dict]]
+        ] = {}
         self.ensamble = {
             'places': [],
             'status': 'in_progress',
@@ -70,6 +154,7 @@ class GMapsScrapper(BaseScrapper):
             'stats': {
                 'text_searches': 0,
                 'details_fetched': 0,
+                'details_skipped_known': 0,
                 'duplicates_by_id': 0,
                 'duplicates_by_location': 0,
                 'new_places': 0,
@@ -105,30 +190,22 @@ class GMapsScrapper(BaseScrapper):
             f'GMapsScrapper initialized for niche: {self.niche}, '
             f'search terms: {len(self.search_terms)}, '
             f'daily quota limit: {self.daily_quota_limit}, '
+            f'fetch details: {self.fetch_details}, '
             f'stage: {settings.stage}, '
             f'companies_table: {settings.companies_table_name}, '
             f'places_table: {settings.places_table_name}'
         )
 
     def _load_search_terms(self) -> List[str]:
-        """Load search terms from niche_terms.json file."""
-        try:
-            terms_file = os.path.join(os.path.dirname(__file__), 'niche_terms.json')
-            with open(terms_file, 'r', encoding='utf-8') as f:
-                terms_data = json.load(f)
-
-            terms = terms_data.get(self.niche, [])
-            if not terms:
-                logger.warning(f'No search terms found for niche: {self.niche}')
-                return []
-
-            logger.info(f'Loaded {len(terms)} search terms for niche: {self.niche}')
-            return terms
-
-        except Exception as e:
-            logger.error(f'Error loading search terms: {str(e)}')
+        """Load search terms for the niche from niche_terms.json."""
+        terms = NICHE_TERMS.get(self.niche, [])
+        if not terms:
+            logger.warning(f'No search terms found for niche: {self.niche}')
             return []
 
+        logger.info(f'Loaded {len(terms)} search terms for niche: {self.niche}')
+        return list(terms)
+
     def _convert_place_to_legacy_format(self, place: Dict) -> Dict:
         """
         Convert new Google Places API format to legacy format for compatibility.
@@ -139,26 +216,23 @@ class GMapsScrapper(BaseScrapper):
         Returns:
             Place data in legacy format
         """
-        legacy_place = {}
-
-        # Place ID - keep as 'id' for consistency
-        if 'id' in place:
-            legacy_place['id'] = place['id']
+        legacy_place = {
+            dst_key: place[src_key]
+            for src_key, dst_key in LEGACY_FIELD_MAP
+            if src_key in place
+        }
 
         # Name
-        if 'displayName' in place:
-            if isinstance(place['displayName'], dict):
-                legacy_place['name'] = place['displayName'].get('text', '')
+        display_name = place.get('displayName')
+        if display_name is not None:
+            if isinstance(display_name, dict):
+                legacy_place['name'] = display_name.get('text', '')
             else:
-                legacy_place['name'] = place['displayName']
-
-        # Address
-        if 'formattedAddress' in place:
-            legacy_place['formatted_address'] = place['formattedAddress']
+                legacy_place['name'] = display_name
 
         # Geometry and Location
-        if 'location' in place:
-            location = place['location']
+        location = place.get('location')
+        if location is not None:
             legacy_place['geometry'] = {
                 'location': {
                     'lat': location.get('latitude'),
@@ -166,62 +240,19 @@ class GMapsScrapper(BaseScrapper):
                 }
             }
 
-        # Rating
-        if 'rating' in place:
-            legacy_place['rating'] = place['rating']
-
-        # User ratings total
-        if 'userRatingCount' in place:
-            legacy_place['user_ratings_total'] = place['userRatingCount']
-
-        # Phone numbers
-        if 'nationalPhoneNumber' in place:
-            legacy_place['formatted_phone_number'] = place['nationalPhoneNumber']
-        if 'internationalPhoneNumber' in place:
-            legacy_place['international_phone_number'] = place[
-                'internationalPhoneNumber'
-            ]
-
-        # Website
-        if 'websiteUri' in place:
-            legacy_place['website'] = place['websiteUri']
-
-        # Google Maps URL
-        if 'googleMapsUri' in place:
-            legacy_place['url'] = place['googleMapsUri']
-
         # Opening hours
-        if 'currentOpeningHours' in place:
-            opening_hours = place['currentOpeningHours']
+        opening_hours = place.get('currentOpeningHours')
+        if opening_hours is not None:
             legacy_place['opening_hours'] = {
                 'open_now': opening_hours.get('openNow', False),
                 'weekday_text': opening_hours.get('weekdayDescriptions', []),
             }
-        elif 'regularOpeningHours' in place:
-            opening_hours = place['regularOpeningHours']
-            legacy_place['opening_hours'] = {
-                'weekday_text': opening_hours.get('weekdayDescriptions', []),
-            }
-
-        # Business status
-        if 'businessStatus' in place:
-            legacy_place['business_status'] = place['businessStatus']
-
-        # Types
-        if 'types' in place:
-            legacy_place['types'] = place['types']
-
-        # Photos
-        if 'photos' in place:
-            legacy_place['photos'] = place['photos']
-
-        # Reviews
-        if 'reviews' in place:
-            legacy_place['reviews'] = place['reviews']
-
-        # Price level
-        if 'priceLevel' in place:
-            legacy_place['price_level'] = place['priceLevel']
+        else:
+            opening_hours = place.get('regularOpeningHours')
+            if opening_hours is not None:
+                legacy_place['opening_hours'] = {
+                    'weekday_text': opening_hours.get('weekdayDescriptions', []),
+                }
 
         return legacy_place
 
@@ -238,9 +269,6 @@ class GMapsScrapper(BaseScrapper):
         Returns:
             Distance in meters
         """
-        # Earth's radius in meters
-        R = 6371000
-
         # Convert to radians
         lat1_rad = math.radians(lat1)
         lat2_rad = math.radians(lat2)
@@ -254,44 +282,104 @@ class GMapsScrapper(BaseScrapper):
         )
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-        distance = R * c
+        distance = EARTH_RADIUS_METERS * c
         return distance
 
-    def _is_duplicate_location(
-        self, new_lat: float, new_lng: float, existing_places: List[Dict]
-    ) -> Optional[Dict]:
+    def _add_place(
+        self, place: Dict, lat: Optional[float], lng: Optional[float]
+    ) -> None:
         """
-        Check if a location is duplicate based on proximity.
+        Add a place to the collection and index its coordinates.
+
+        Args:
+            place: Place data in legacy format
+            lat: Latitude of the place (None if unknown)
+            lng: Longitude of the place (None if unknown)
+        """
+        self.ensamble['places'].append(place)
+        if lat is not None and lng is not None:
+            lat_rad = math.radians(lat)
+            self._coord_grid.setdefault(self._grid_cell(lat, lng), []).append(
+                (lat_rad, math.radians(lng), math.cos(lat_rad), place)
+            )
+
+    def _grid_cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        """Get the duplicate index grid cell for a coordinate."""
+        return (
+            math.floor(lat / DUPLICATE_GRID_CELL_DEGREES),
+            math.floor(lng / DUPLICATE_GRID_CELL_DEGREES),
+        )
+
+    def _is_duplicate_location(self, new_lat: float, new_lng: float) -> Optional[Dict]:
+        """
+        Check if a location is duplicate of a collected place based on proximity.
 
         Args:
             new_lat: Latitude of new place
             new_lng: Longitude of new place
-            existing_places: List of existing places to check against
 
         Returns:
             Existing place dict if duplicate found within threshold, None otherwise
         """
-        for place in existing_places:
-            geometry = place.get('geometry', {})
-            location = geometry.get('location', {})
-            existing_lat = location.get('lat')
-            existing_lng = location.get('lng')
+        new_lat_rad = math.radians(new_lat)
+        new_lng_rad = math.radians(new_lng)
+        new_cos_lat = math.cos(new_lat_rad)
+        sin = math.sin
+        cell_lat, cell_lng = self._grid_cell(new_lat, new_lng)
+
+        for d_lat in (-1, 0, 1):
+            for d_lng in (-1, 0, 1):
+                neighbours = self._coord_grid.get((cell_lat + d_lat, cell_lng + d_lng))
+                if not neighbours:
+                    continue
 
-            if existing_lat is None or existing_lng is None:
-                continue
+                for lat_rad, lng_rad, cos_lat, place in neighbours:
+                    a = (
+                        sin((lat_rad - new_lat_rad) / 2) ** 2
+                        + new_cos_lat * cos_lat * sin((lng_rad - new_lng_rad) / 2) ** 2
+                    )
+                    if a <= DUPLICATE_HAVERSINE_THRESHOLD:
+                        distance = 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+                        logger.info(
+                            f'Duplicate location found: {place.get("name")} - '
+                            f'Distance: {distance:.2f}m'
+                        )
+                        return place
 
-            distance = self._calculate_distance(
-                new_lat, new_lng, existing_lat, existing_lng
-            )
+        return None
 
-            if distance <= DUPLICATE_DISTANCE_THRESHOLD_METERS:
-                logger.info(
-                    f'Duplicate location found: {place.get("name")} - '
-                    f'Distance: {distance:.2f}m'
-                )
-                return place
+    def _compute_data_hash(self, place: Dict) -> str:
+        """
+        Compute a stable content hash for a place.
 
-        return None
+        Keys are sorted so nested values (geometry, photos, reviews) produce the
+        same digest regardless of field order in the API response. Decimals
+        read back from DynamoDB (e.g. reused reviews) hash like the fresh ints
+        and floats they were stored from.
+
+        Args:
+            place: Place data in legacy format
+
+        Returns:
+            Hex digest stored as `dataHash` in the places table
+        """
+        payload = json.dumps(place, sort_keys=True, default=self._hash_default)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _hash_default(value):
+        """
+        Convert values json cannot encode for the data hash.
+
+        Args:
+            value: Value json.dumps could not serialize
+
+        Returns:
+            int or float for Decimals, str for anything else
+        """
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        return str(value)
 
     def _check_quota(self, required_quota: int) -> bool:
         """
@@ -356,6 +444,18 @@ class GMapsScrapper(BaseScrapper):
         full_query = f'{query} em {city}, {state}, Brasil'
         logger.info(f'Starting text search for: {full_query}')
 
+        # Headers and body are shared by every page; only the token changes
+        headers = {
+            'Content-Type': 'application/json',
+            'X-Goog-Api-Key': self.api_key,
+            'X-Goog-FieldMask': TEXT_SEARCH_FIELD_MASK,
+        }
+        body = {
+            'textQuery': full_query,
+            'languageCode': 'pt-BR',
+        }
+        last_request_at = 0.0
+
         while True:
             # Check quota before making request
             if not self._check_quota(TEXT_SEARCH_QUOTA_COST):
@@ -366,29 +466,15 @@ class GMapsScrapper(BaseScrapper):
                 break
 
             try:
-                headers = {
-                    'Content-Type': 'application/json',
-                    'X-Goog-Api-Key': self.api_key,
-                    'X-Goog-FieldMask': (
-                        'places.id,places.displayName,places.formattedAddress,'
-                        'places.location,places.rating,places.userRatingCount,'
-                        'places.businessStatus,places.types,places.photos,'
-                        'places.currentOpeningHours,places.nationalPhoneNumber,'
-                        'places.internationalPhoneNumber,places.websiteUri,'
-                        'places.googleMapsUri,places.priceLevel,nextPageToken'
-                    ),
-                }
-
-                body = {
-                    'textQuery': full_query,
-                    'languageCode': 'pt-BR',
-                }
-
                 if next_page_token:
                     body['pageToken'] = next_page_token
-                    # Google requires 2-second delay before using page token
-                    time.sleep(2)
+                    # Google requires 2-second delay before using page token,
+                    # only wait for whatever part of it has not elapsed yet
+                    elapsed = time.monotonic() - last_request_at
+                    if elapsed < PAGE_TOKEN_DELAY_SECONDS:
+                        time.sleep(PAGE_TOKEN_DELAY_SECONDS - elapsed)
 
+                last_request_at = time.monotonic()
                 response = requests.post(
                     PLACES_TEXT_SEARCH_URL, json=body, headers=headers, timeout=10
                 )
@@ -450,21 +536,22 @@ class GMapsScrapper(BaseScrapper):
         Returns:
             Detailed place information dict (in legacy format) or None on error
         """
-        # Check quota before making request
-        if not self._check_quota(PLACE_DETAILS_QUOTA_COST):
-            logger.warning(f'Skipping place details for {place_id} due to quota limit')
-            return None
+        # Reserve quota before making request, since details are fetched
+        # concurrently and each worker must see the others' reservations
+        with self._quota_lock:
+            if not self._check_quota(PLACE_DETAILS_QUOTA_COST):
+                logger.warning(
+                    f'Skipping place details for {place_id} due to quota limit'
+                )
+                return None
+            self.quota_used += PLACE_DETAILS_QUOTA_COST
+            self.ensamble['quota_used'] = self.quota_used
 
         try:
             headers = {
                 'Content-Type': 'application/json',
                 'X-Goog-Api-Key': self.api_key,
-                'X-Goog-FieldMask': (
-                    'id,displayName,formattedAddress,location,rating,'
-                    'userRatingCount,nationalPhoneNumber,internationalPhoneNumber,'
-                    'websiteUri,googleMapsUri,currentOpeningHours,regularOpeningHours,'
-                    'businessStatus,types,photos,reviews,priceLevel'
-                ),
+                'X-Goog-FieldMask': PLACE_DETAILS_FIELD_MASK,
             }
 
             # New API uses resource name format: places/{PLACE_ID}
@@ -474,10 +561,8 @@ class GMapsScrapper(BaseScrapper):
             response.raise_for_status()
             place_data = response.json()
 
-            # Update quota
-            self.quota_used += PLACE_DETAILS_QUOTA_COST
-            self.ensamble['quota_used'] = self.quota_used
-            self.ensamble['stats']['details_fetched'] += 1
+            with self._quota_lock:
+                self.ensamble['stats']['details_fetched'] += 1
 
             # Convert to legacy format for compatibility
             result = self._convert_place_to_legacy_format(place_data)
@@ -490,13 +575,88 @@ class GMapsScrapper(BaseScrapper):
             logger.error(
                 f'Request error fetching place details for {place_id}: {str(e)}'
             )
+            self._release_quota(PLACE_DETAILS_QUOTA_COST)
             return None
         except Exception as e:
             logger.error(
                 f'Unexpected error fetching place details for {place_id}: {str(e)}'
             )
+            self._release_quota(PLACE_DETAILS_QUOTA_COST)
             return None
 
+    def _release_quota(self, quota: int) -> None:
+        """
+        Give back quota reserved for a request that did not complete.
+
+        Args:
+            quota: Quota units to release
+        """
+        with self._quota_lock:
+            self.quota_used -= quota
+            self.ensamble['quota_used'] = self.quota_used
+
+    def _get_existing_place(self, place_id: str) -> Optional[Dict]:
+        """
+        Get a place already stored in the places table, caching the lookup.
+
+        Args:
+            place_id: Google Place ID
+
+        Returns:
+            Deserialized place item or None if not stored
+        """
+        if place_id in self._existing_places:
+            return self._existing_places[place_id]
+
+        existing_place = None
+        if self.db_handler:
+            try:
+                existing_item = self.db_handler.get_item(key={'placeID': place_id})
+                if existing_item:
+                    existing_place = self.db_handler._deserialize_item(existing_item)
+            except Exception as e:
+                logger.debug(f'Place {place_id} not found in database: {str(e)}')
+
+        self._existing_places[place_id] = existing_place
+        return existing_place
+
+    def _enrich_with_details(self, places: List[Dict]) -> None:
+        """
+        Fetch Place Details for a batch of places concurrently.
+
+        Each place dict is updated in place, with details taking precedence
+        over the text search fields. Places already stored in the database
+        reuse their stored detail-only fields instead, unless `force_rescan`.
+
+        Args:
+            places: Places (in legacy format) already added to the collection
+        """
+        if not self.force_rescan:
+            new_places = []
+            for place in places:
+                existing_place = self._get_existing_place(place['id'])
+                if not existing_place:
+                    new_places.append(place)
+                    continue
+
+                for field in DETAIL_ONLY_FIELDS:
+                    if field in existing_place:
+                        place.setdefault(field, existing_place[field])
+                self.ensamble['stats']['details_skipped_known'] += 1
+
+            places = new_places
+            if not places:
+                return
+
+        max_workers = min(DETAILS_MAX_WORKERS, len(places))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            details = executor.map(
+                lambda place: self._get_place_details(place['id']), places
+            )
+            for place, detailed_info in zip(places, details):
+                if detailed_info:
+                    place.update(detailed_info)
+
     def _queue_website_scraping_task(
         self, company_id: str, website: str, city: str, state: str
     ) -> None:
@@ -518,7 +678,7 @@ class GMapsScrapper(BaseScrapper):
                 return
 
             region = os.environ.get('AWS_REGION_NAME', settings.region)
-            sqs_client = boto3.client('sqs', region_name=region)
+            sqs_client = get_boto_client('sqs', region)
             message_body = json.dumps(
                 {
                     'company_id': company_id,
@@ -579,30 +739,18 @@ class GMapsScrapper(BaseScrapper):
                         )
                         continue
 
+                    data_hash = self._compute_data_hash(place)
+
                     # Check if place already exists in database
-                    existing_place = None
-                    try:
-                        existing_place = self.db_handler.get_item(
-                            key={'placeID': place_id},
-                        )
-                    except Exception as e:
-                        logger.debug(
-                            f'Place {place_id} not found in database: {str(e)}'
-                        )
+                    existing_place = self._get_existing_place(place_id)
 
                     if existing_place:
                         # Check if data has changed
-                        needs_update = False
-                        for key, value in place.items():
-                            if existing_place.get(key) != value:
-                                needs_update = True
-                                break
-
-                        if needs_update:
+                        if existing_place.get('dataHash') != data_hash:
                             # Update existing place
                             self.db_handler.update_item(
                                 key={'placeID': place_id},
-                                updates=place,
+                                updates={**place, 'dataHash': data_hash},
                                 primary_key='placeID',
                             )
                             self.ensamble['stats']['updated_places'] += 1
@@ -648,6 +796,7 @@ class GMapsScrapper(BaseScrapper):
                     place_data = {
                         'placeID': place_id,
                         'companyID': company_id,
+                        'dataHash': data_hash,
                         **place_without_id,
                     }
 
@@ -718,6 +867,7 @@ class GMapsScrapper(BaseScrapper):
 
         # Track unique place IDs to avoid duplicates
         seen_place_ids = set()
+        stats = self.ensamble['stats']
 
         # Iterate through each search term
         for idx, term in enumerate(self.search_terms, 1):
@@ -727,6 +877,7 @@ class GMapsScrapper(BaseScrapper):
 
             # Perform text search
             text_results = self._search_places_text_search(term, city, state)
+            pending_details = []
 
             # Process each result
             for result in text_results:
@@ -736,54 +887,48 @@ class GMapsScrapper(BaseScrapper):
 
                 # Check for id duplicate
                 if place_id in seen_place_ids:
-                    self.ensamble['stats']['duplicates_by_id'] += 1
+                    stats['duplicates_by_id'] += 1
                     logger.debug(f'Duplicate place_id: {place_id}')
                     continue
 
                 # Check for location-based duplicate
-                geometry = result.get('geometry', {})
-                location = geometry.get('location', {})
+                location = result.get('geometry', {}).get('location', {})
                 lat = location.get('lat')
                 lng = location.get('lng')
-
-                if lat is not None and lng is not None:
-                    duplicate = self._is_duplicate_location(
-                        lat, lng, self.ensamble['places']
-                    )
-                    if duplicate:
-                        self.ensamble['stats']['duplicates_by_location'] += 1
-                        continue
+                if (
+                    lat is not None
+                    and lng is not None
+                    and self._is_duplicate_location(lat, lng)
+                ):
+                    stats['duplicates_by_location'] += 1
+                    continue
 
                 # Mark as seen
                 seen_place_ids.add(place_id)
 
-                # Enrich with place details if quota allows
-                detailed_info = self._get_place_details(place_id)
-                if detailed_info:
-                    # Merge text search and detailed info
-                    merged_place = {**result, **detailed_info}
-                else:
-                    # Use text search data only
-                    merged_place = result
-
                 # Add to collection
-                self.ensamble['places'].append(merged_place)
-                logger.debug(
-                    f'Added place: {merged_place.get("name")} (ID: {place_id})'
-                )
-
-            # Check if we should continue (quota exceeded)
-            if self.ensamble['status'] == 'partial_quota_exceeded':
+                self._add_place(result, lat, lng)
+                logger.debug(f'Added place: {result.get("name")} (ID: {place_id})')
+
+                # Text search already covers every persisted field except
+                # reviews, so details are only fetched when enabled
+                if self.fetch_details:
+                    pending_details.append(result)
+
+            # Enrich this term's new places with details if quota allows
+            if pending_details:
+                self._enrich_with_details(pending_details)
+
+            # Check if we should continue (quota exceeded or API failing).
+            # No pacing is needed between terms: each one is a new query and
+            # only page tokens require a delay, handled in the text search.
+            if self.ensamble['status'] in STOP_COLLECTION_STATUSES:
                 logger.warning(
                     f'Stopping collection after term {idx}/{len(self.search_terms)} '
-                    f'due to quota limit'
+                    f'due to status: {self.ensamble["status"]}'
                 )
                 break
 
-            # Rate limiting between search terms
-            if idx < len(self.search_terms):
-                time.sleep(1)
-
         # Log collection summary
         logger.info(
             f'Place collection completed - '
@@ -5,25 +5,34 @@ This module provides HTML-only scraping with LLM-powered data extraction
 using Google Gemini API to structure information from company websites.
 """
 
+import hashlib
 import json
+import math
 import os
-import random
 import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
 import boto3
+import lxml.html
 import requests
 from auris_tools.databaseHandlers import DatabaseHandler
 from auris_tools.geminiHandler import GoogleGeminiHandler
 from aws_lambda_powertools import Logger
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.models.scrappers import BaseScrapper
 from src.shared.settings import settings
+from src.shared.utils import get_boto_client
 
 # Configure logger
 logger = Logger(service='website-scraper')
@@ -32,8 +41,197 @@ logger = Logger(service='website-scraper')
 MAX_PAGES_PER_SITE = 15
 REQUEST_TIMEOUT = 10
 USER_AGENT = 'AurisBot/1.0 (+https://auris.com.br/bot)'
-MIN_DELAY_SECONDS = 2
-MAX_DELAY_SECONDS = 3
+FETCH_MAX_WORKERS = 5
+# Per-host request rate shared by page validation and fetching: one request
+# every 2s after an initial burst, in line with the previous 2-3s pacing
+RATE_LIMIT_PER_SECOND = 0.5
+RATE_LIMIT_BURST = 5
+# HEAD probes during discovery transfer no body, so they cost a fraction of
+# a page-fetch token
+PROBE_TOKEN_COST = 0.25
+# Candidates probed during discovery, keeping the most relevant by score_url
+MAX_PROBE_CANDIDATES = 3 * MAX_PAGES_PER_SITE
+SITEMAP_MAX_URLS = 10000
+# Page bodies are read in chunks and cut off after this many bytes
+PAGE_MAX_BYTES = 512 * 1024
+PAGE_CHUNK_SIZE = 16384
+# Character budget for all page text sent to Gemini (~75k tokens)
+PROMPT_TEXT_CHAR_BUDGET = 300000
+# A line on at least this share of pages (and at least 2) is boilerplate
+BOILERPLATE_PAGE_RATIO = 0.6
+# Load the Gemini response schema once per container instead of per call
+RESPONSE_SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), 'website_gemini_schema.json'
+)
+with open(RESPONSE_SCHEMA_PATH, 'r', encoding='utf-8') as f:
+    RESPONSE_SCHEMA = json.load(f)
+
+# robots.txt parsers keyed by scheme://netloc with the time they were cached,
+# shared across instances in a warm Lambda container. None marks a host whose
+# robots.txt could not be read; those entries expire sooner so it is retried.
+_ROBOTS_CACHE: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
+_ROBOTS_CACHE_LOCK = threading.Lock()
+ROBOTS_CACHE_TTL_SECONDS = 6 * 3600
+ROBOTS_NEGATIVE_CACHE_TTL_SECONDS = 300
+
+# Keywords in a sitemap URL path that indicate important pages
+SITEMAP_PRIORITY_KEYWORDS = (
+    'about',
+    'sobre',
+    'quem-somos',
+    'contact',
+    'contato',
+    'fale-conosco',
+    'service',
+    'servico',
+    'servicos',
+    'product',
+    'produto',
+    'produtos',
+    'empresa',
+    'company',
+    'historia',
+)
+_SITEMAP_PRIORITY_RE = re.compile(
+    '|'.join(re.escape(keyword) for keyword in SITEMAP_PRIORITY_KEYWORDS)
+)
+
+# Sitemap URLs to exclude (blog posts, pagination, query params and anchors)
+_EXCLUDE_RE = re.compile(
+    r'/blog/|/news/|/noticia/|/artigo/|/page/\d+|/p/\d+|/\d{4}/\d{2}/'
+    r'|/category/|/tag/|/author/|\?|#',
+    re.IGNORECASE,
+)
+
+# Links inside navigation areas on the homepage: nav/header/footer/menu tags
+# and elements whose class mentions nav, menu or header
+NAV_LINK_SELECTOR = (
+    ':is(nav, header, footer, menu, [class*=nav i], [class*=menu i], '
+    '[class*=header i]) a[href]'
+)
+
+# Keywords in a navigation link path that indicate relevant pages
+LINK_PRIORITY_KEYWORDS = (
+    'sobre',
+    'about',
+    'quem-somos',
+    'contato',
+    'contact',
+    'fale-conosco',
+    'servico',
+    'service',
+    'servicos',
+    'produto',
+    'product',
+    'produtos',
+    'empresa',
+    'company',
+)
+_LINK_PRIORITY_RE = re.compile(
+    '|'.join(re.escape(keyword) for keyword in LINK_PRIORITY_KEYWORDS)
+)
+# Bytes of page content one link-priority point is worth when ranking pages
+LINK_PRIORITY_WEIGHT = 5000
+
+# Collapses any whitespace run containing a newline, or two or more spaces,
+# into a single newline when cleaning extracted page text
+_WHITESPACE_RE = re.compile(r'\s*\n\s*|[ \t]*  [ \t]*')
+
+# Dates, times and whitespace are ignored when fingerprinting page text, so
+# pages that only differ by a timestamp or layout collapse to the same key.
+# Other digits are kept: branch pages often differ only by phone, CEP or
+# street number, which is exactly the data being extracted.
+_FINGERPRINT_STRIP_RE = re.compile(
+    r'\d{1,4}[/.-]\d{1,2}[/.-]\d{2,4}|\d{1,2}:\d{2}(?::\d{2})?|\s+'
+)
+
+# Request rate limiters keyed by host, shared across instances
+_RATE_LIMITERS: Dict[str, '_RateLimiter'] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket limiting the request rate to a single host.
+
+    Args:
+        rate (float): Tokens added per second
+        max_tokens (int): Bucket capacity, i.e. the allowed burst size
+    """
+
+    def __init__(self, rate: float, max_tokens: int):
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait_for_token(self, cost: float = 1.0) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            cost: Number of tokens the request consumes (default: 1.0)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_tokens, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # Reserve the token now; a negative balance is the queue ahead of us
+            self._tokens -= cost
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+def _get_rate_limiter(host: str) -> _RateLimiter:
+    """
+    Return the shared rate limiter for a host, creating it on first use.
+
+    Args:
+        host: Host name (netloc) of the URLs being fetched
+
+    Returns:
+        Rate limiter for the host
+    """
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _RateLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+            _RATE_LIMITERS[host] = limiter
+        return limiter
+
+
+def score_url(url: str) -> float:
+    """
+    Score a URL by relevance based on keywords in its path.
+
+    Args:
+        url: URL to score
+
+    Returns:
+        Number of keyword matches minus a small penalty per path level
+    """
+    path = urlparse(url).path.lower()
+    # Count keyword matches; most paths match none, so a single regex search
+    # rules those out before counting (overlapping keywords count separately)
+    matches = 0
+    if _LINK_PRIORITY_RE.search(path):
+        matches = sum(1 for kw in LINK_PRIORITY_KEYWORDS if kw in path)
+    # Prefer shorter paths (closer to root)
+    depth_penalty = path.count('/') * 0.1
+    return matches - depth_penalty
 
 
 class WebsiteScrapper(BaseScrapper):
@@ -77,6 +275,39 @@ class WebsiteScrapper(BaseScrapper):
             'data_extracted': {},
         }
 
+        # Parsed robots.txt for the site, set by _check_robots_txt
+        self._robots: Optional[RobotFileParser] = None
+
+        # Page bodies downloaded during discovery, reused by later fetches
+        self._body_cache: Dict[str, str] = {}
+
+        # Extracted text keyed by a digest of the HTML it came from
+        self._text_cache: Dict[bytes, str] = {}
+
+        # Fetch counters are updated from worker threads
+        self._stats_lock = threading.Lock()
+
+        # Single pooled session so every fetch to the site reuses the same
+        # TCP/TLS connection instead of opening a new one per request
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        # Retry transient gateway errors with backoff; other statuses are
+        # returned as-is and handled by the callers
+        retries = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Side tasks (SQS) run here so they overlap with the DynamoDB save;
+        # close() waits for them before the Lambda returns
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+
         # Initialize database handler
         try:
             self.db_handler = DatabaseHandler(
@@ -89,9 +320,14 @@ class WebsiteScrapper(BaseScrapper):
             logger.warning(f'DatabaseHandler initialization failed: {str(e)}')
             self.db_handler = None
 
-        # Initialize Gemini handler
+        # Initialize Gemini handler, configured once for structured extraction
         try:
-            self.gemini_handler = GoogleGeminiHandler(api_key=gemini_api_key)
+            self.gemini_handler = GoogleGeminiHandler(
+                api_key=gemini_api_key,
+                temperature=0.0,
+                response_mime_type='application/json',
+                response_schema=RESPONSE_SCHEMA,
+            )
         except Exception as e:
             logger.error(f'GoogleGeminiHandler initialization failed: {str(e)}')
             raise
@@ -131,10 +367,50 @@ class WebsiteScrapper(BaseScrapper):
 
         return url
 
+    @staticmethod
+    def _canonical_url(url: str) -> str:
+        """
+        Build a canonical key for a URL to deduplicate discovered pages.
+
+        Lowercases scheme and host and drops the fragment and trailing slash.
+
+        Args:
+            url: URL to canonicalize
+
+        Returns:
+            Canonical form of the URL
+        """
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/')
+        query = f'?{parsed.query}' if parsed.query else ''
+        return f'{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}{query}'
+
+    @staticmethod
+    def _robots_cache_fresh(rp: Optional[RobotFileParser], cached_at: float) -> bool:
+        """
+        Check whether a cached robots.txt entry is still within its TTL.
+
+        Args:
+            rp: Cached parser, or None if robots.txt could not be read
+            cached_at: time.monotonic() value when the entry was stored
+
+        Returns:
+            True if the entry can be reused
+        """
+        ttl = (
+            ROBOTS_CACHE_TTL_SECONDS
+            if rp is not None
+            else ROBOTS_NEGATIVE_CACHE_TTL_SECONDS
+        )
+        return time.monotonic() - cached_at < ttl
+
     def _check_robots_txt(self, base_url: str) -> bool:
         """
         Check if scraping is allowed by robots.txt.
 
+        The parsed robots.txt is cached per host and kept on the instance so
+        every page fetched afterwards is checked against it too.
+
         Args:
             base_url: Base URL of the website
 
@@ -142,17 +418,44 @@ class WebsiteScrapper(BaseScrapper):
             True if allowed, False otherwise
         """
         try:
-            robots_url = urljoin(base_url, '/robots.txt')
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
+            parsed = urlparse(base_url)
+            host_key = f'{parsed.scheme}://{parsed.netloc}'
 
-            # Read robots.txt - this fetches it from the URL
-            try:
-                rp.read()
-            except Exception as read_error:
-                logger.warning(
-                    f'Could not read robots.txt from {robots_url}: {str(read_error)}'
-                )
+            with _ROBOTS_CACHE_LOCK:
+                cached = _ROBOTS_CACHE.get(host_key)
+
+            if cached is not None and self._robots_cache_fresh(*cached):
+                rp = cached[0]
+                logger.debug(f'Using cached robots.txt for {host_key}')
+            else:
+                robots_url = urljoin(base_url, '/robots.txt')
+                rp = RobotFileParser()
+                rp.set_url(robots_url)
+
+                # Fetch robots.txt over the pooled session, mirroring
+                # RobotFileParser.read() status handling
+                try:
+                    response = self._session.get(robots_url, timeout=self.timeout)
+                    if response.status_code in (401, 403):
+                        rp.disallow_all = True
+                    elif 400 <= response.status_code < 500:
+                        rp.allow_all = True
+                    elif response.status_code >= 500:
+                        raise requests.exceptions.HTTPError(
+                            f'HTTP {response.status_code}'
+                        )
+                    else:
+                        rp.parse(response.text.splitlines())
+                except Exception as read_error:
+                    logger.warning(
+                        f'Could not read robots.txt from {robots_url}: {str(read_error)}'
+                    )
+                    rp = None
+                with _ROBOTS_CACHE_LOCK:
+                    _ROBOTS_CACHE[host_key] = (rp, time.monotonic())
+
+            self._robots = rp
+            if rp is None:
                 # If we can't read robots.txt, assume it's okay to proceed
                 return True
 
@@ -174,7 +477,8 @@ class WebsiteScrapper(BaseScrapper):
         This method:
         1. Collects all available page URLs from multiple strategies
         2. Validates that each URL is actually accessible
-        3. Ranks pages by HTML content size and selects top MAX_PAGES_PER_SITE
+        3. Ranks pages by content size weighted with link relevance and selects
+           the top MAX_PAGES_PER_SITE
 
         Strategies used:
         - Homepage navigation links
@@ -185,46 +489,54 @@ class WebsiteScrapper(BaseScrapper):
             base_url: Base URL of the website
 
         Returns:
-            List of validated page URLs ranked by content size
+            List of validated page URLs ranked by relevance and content size
         """
         logger.info(f'Starting page discovery for {base_url}')
 
-        # Step 1: Collect all candidate URLs from all strategies
-        candidate_urls = set()
+        # Step 1: Collect all candidate URLs from all strategies, keyed by
+        # canonical URL and kept in discovery (priority) order
+        candidate_urls: Dict[str, str] = {}
+
+        def add_candidates(pages: List[str]) -> None:
+            for page in pages:
+                candidate_urls.setdefault(self._canonical_url(page), page)
 
         # Strategy 1: Homepage navigation links
         logger.info('Strategy 1: Discovering pages from homepage navigation')
         homepage_pages = self._discover_pages_from_homepage(base_url)
-        candidate_urls.update(homepage_pages)
+        add_candidates(homepage_pages)
         logger.info(f'Found {len(homepage_pages)} pages from homepage navigation')
 
         # Strategy 2: Sitemap.xml
         logger.info('Strategy 2: Discovering pages from sitemap.xml')
         sitemap_pages = self._discover_pages_from_sitemap(base_url)
-        candidate_urls.update(sitemap_pages)
+        add_candidates(sitemap_pages)
         logger.info(f'Found {len(sitemap_pages)} pages from sitemap')
 
         # Strategy 3: Common paths
         logger.info('Strategy 3: Discovering pages from common paths')
         common_pages = self._discover_pages_common_paths(base_url)
-        candidate_urls.update(common_pages)
+        add_candidates(common_pages)
         logger.info(f'Found {len(common_pages)} pages from common paths')
 
         logger.info(f'Total unique candidate URLs: {len(candidate_urls)}')
 
-        # Step 2: Validate URLs and collect content size
-        valid_pages = []
-        for idx, url in enumerate(candidate_urls):
-            # Rate limiting between validation requests
-            if idx > 0 and idx % 5 == 0:
-                delay = random.uniform(0.5, 1.5)
-                time.sleep(delay)
-
-            logger.debug(f'Validating URL ({idx + 1}/{len(candidate_urls)}): {url}')
-            html_content = self._fetch_page_content(url)
+        # Step 2: Validate URLs and collect content size. Large sitemaps would
+        # otherwise spend the whole rate limit budget on probes, so only the
+        # most relevant candidates are probed; the stable sort keeps discovery
+        # order among equal scores.
+        candidates = sorted(candidate_urls.values(), key=score_url, reverse=True)[
+            :MAX_PROBE_CANDIDATES
+        ]
+        if len(candidates) < len(candidate_urls):
+            logger.info(
+                f'Probing the top {len(candidates)} of {len(candidate_urls)} candidates'
+            )
 
-            if html_content:
-                content_size = len(html_content)
+        valid_pages = []
+        probed = self._fetch_all(candidates, fetcher=self._probe_page_size)
+        for url, content_size in probed:
+            if content_size:
                 valid_pages.append((url, content_size))
                 logger.debug(f'Valid URL with {content_size} bytes: {url}')
             else:
@@ -239,16 +551,21 @@ class WebsiteScrapper(BaseScrapper):
             logger.warning('No valid pages found')
             return []
 
-        # Sort by content size (descending) - pages with more content first
-        valid_pages.sort(key=lambda x: x[1], reverse=True)
+        # Rank by content size weighted with link relevance, so large pages
+        # still win but on-topic pages (about, contact, services) come first.
+        # The sort is stable, so equal scores keep their discovery priority.
+        valid_pages.sort(
+            key=lambda page: score_url(page[0]) * LINK_PRIORITY_WEIGHT + page[1],
+            reverse=True,
+        )
 
         # Select top MAX_PAGES_PER_SITE pages
         selected_pages = [url for url, size in valid_pages[:MAX_PAGES_PER_SITE]]
 
         logger.info(
-            f'Selected top {len(selected_pages)} pages by content size '
-            f'(range: {valid_pages[-1][1] if len(valid_pages) > 0 else 0} - '
-            f'{valid_pages[0][1]} bytes)'
+            f'Selected top {len(selected_pages)} pages by relevance and content size '
+            f'(range: {min(size for _, size in valid_pages)} - '
+            f'{max(size for _, size in valid_pages)} bytes)'
         )
 
         return selected_pages
@@ -270,34 +587,95 @@ class WebsiteScrapper(BaseScrapper):
             '/sitemap1.xml',
         ]
 
-        for sitemap_path in sitemap_paths:
-            try:
-                sitemap_url = urljoin(base_url, sitemap_path)
-                response = requests.get(
-                    sitemap_url,
-                    headers={'User-Agent': USER_AGENT},
-                    timeout=self.timeout,
-                    verify=True,
+        # Probe all candidate paths at once, then take the first hit in path
+        # order so the result does not depend on which response lands first.
+        # Bodies are streamed so only the winning sitemap is actually read.
+        with ThreadPoolExecutor(max_workers=len(sitemap_paths)) as executor:
+            futures = [
+                (
+                    sitemap_path,
+                    executor.submit(
+                        self._session.get,
+                        urljoin(base_url, sitemap_path),
+                        timeout=self.timeout,
+                        stream=True,
+                    ),
                 )
+                for sitemap_path in sitemap_paths
+            ]
 
-                if response.status_code == 200:
-                    # Parse XML sitemap
-                    soup = BeautifulSoup(response.content, 'xml')
-                    urls = [loc.text.strip() for loc in soup.find_all('loc')]
+        try:
+            for sitemap_path, future in futures:
+                try:
+                    sitemap_url = urljoin(base_url, sitemap_path)
+                    response = future.result()
+
+                    if response.status_code == 200:
+                        response.raw.decode_content = True
+                        urls = self._parse_sitemap_locs(response.raw)
+
+                        if urls:
+                            logger.debug(
+                                f'Found sitemap at {sitemap_url} with {len(urls)} URLs'
+                            )
+                            # Filter and prioritize main pages
+                            filtered_urls = self._filter_main_pages(urls)
+                            return filtered_urls
+
+                except Exception as e:
+                    logger.debug(f'Failed to fetch sitemap {sitemap_path}: {str(e)}')
+                    continue
+        finally:
+            # Release every streamed connection back to the pool
+            for _, future in futures:
+                if future.exception() is None:
+                    future.result().close()
 
-                    if urls:
-                        logger.debug(
-                            f'Found sitemap at {sitemap_url} with {len(urls)} URLs'
-                        )
-                        # Filter and prioritize main pages
-                        filtered_urls = self._filter_main_pages(urls)
-                        return filtered_urls
+        return []
 
-            except Exception as e:
-                logger.debug(f'Failed to fetch sitemap {sitemap_path}: {str(e)}')
-                continue
+    @staticmethod
+    def _parse_sitemap_locs(source: BinaryIO) -> List[str]:
+        """
+        Stream <loc> entries out of a sitemap without building the full tree.
 
-        return []
+        The parser is lenient, since sitemaps are often slightly malformed,
+        and never expands entities or touches the network. Parsed elements
+        are discarded as soon as they are read and reading stops after
+        SITEMAP_MAX_URLS entries.
+
+        Args:
+            source: Binary file-like object with the sitemap XML, e.g. a
+                streamed response's raw body
+
+        Returns:
+            List of URLs found in the sitemap
+        """
+        urls = []
+        events = etree.iterparse(
+            source,
+            tag='{*}loc',
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        try:
+            for _, element in events:
+                if element.text and element.text.strip():
+                    urls.append(element.text.strip())
+                element.clear()
+
+                # Drop already processed <url> siblings to keep memory flat
+                parent = element.getparent()
+                if parent is not None:
+                    while parent.getprevious() is not None:
+                        del parent.getparent()[0]
+
+                if len(urls) >= SITEMAP_MAX_URLS:
+                    break
+        except etree.XMLSyntaxError as e:
+            logger.debug(f'Sitemap parsing stopped early: {str(e)}')
+
+        return urls
 
     def _filter_main_pages(self, urls: List[str]) -> List[str]:
         """
@@ -309,54 +687,17 @@ class WebsiteScrapper(BaseScrapper):
         Returns:
             Filtered and prioritized list of URLs
         """
-        # Keywords that indicate important pages
-        priority_keywords = [
-            'about',
-            'sobre',
-            'quem-somos',
-            'contact',
-            'contato',
-            'fale-conosco',
-            'service',
-            'servico',
-            'servicos',
-            'product',
-            'produto',
-            'produtos',
-            'empresa',
-            'company',
-            'historia',
-        ]
-
-        # Patterns to exclude (blog posts, pagination, etc.)
-        exclude_patterns = [
-            r'/blog/',
-            r'/news/',
-            r'/noticia/',
-            r'/artigo/',
-            r'/page/\d+',
-            r'/p/\d+',
-            r'/\d{4}/\d{2}/',
-            r'/category/',
-            r'/tag/',
-            r'/author/',
-            r'\?',
-            r'#',  # Query params and anchors
-        ]
-
         filtered = []
         priority_urls = []
 
         for url in urls:
             # Skip if matches exclude patterns
-            if any(
-                re.search(pattern, url, re.IGNORECASE) for pattern in exclude_patterns
-            ):
+            if _EXCLUDE_RE.search(url):
                 continue
 
             # Check if it's a priority page
             path = urlparse(url).path.lower()
-            if any(kw in path for kw in priority_keywords):
+            if _SITEMAP_PRIORITY_RE.search(path):
                 priority_urls.append(url)
             else:
                 filtered.append(url)
@@ -379,41 +720,35 @@ class WebsiteScrapper(BaseScrapper):
             if not html:
                 return []
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             parsed_base = urlparse(base_url)
             base_domain = f'{parsed_base.scheme}://{parsed_base.netloc}'
 
             # Find links in navigation, header, footer, and main menu areas
-            nav_areas = soup.find_all(['nav', 'header', 'footer', 'menu'])
-            # Also check for common nav class names
-            nav_areas.extend(
-                soup.find_all(class_=re.compile(r'nav|menu|header', re.IGNORECASE))
-            )
-
+            # (including common nav class names) in a single tree walk
             links = set()
 
-            for area in nav_areas:
-                for a_tag in area.find_all('a', href=True):
-                    href = a_tag['href'].strip()
+            for a_tag in soup.select(NAV_LINK_SELECTOR):
+                href = a_tag['href'].strip()
 
-                    # Skip empty, anchor-only, or javascript links
-                    if not href or href.startswith(
-                        ('#', 'javascript:', 'mailto:', 'tel:')
-                    ):
-                        continue
+                # Skip empty, anchor-only, or javascript links
+                if not href or href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                    continue
 
-                    # Convert relative to absolute URL
-                    full_url = urljoin(base_domain, href)
-                    parsed_url = urlparse(full_url)
+                # Convert relative to absolute URL
+                full_url = urljoin(base_domain, href)
+                parsed_url = urlparse(full_url)
 
-                    # Only include same-domain links
-                    if parsed_url.netloc == parsed_base.netloc:
-                        # Clean URL (remove anchors and query params for deduplication)
-                        clean_url = f'{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}'
-                        clean_url = clean_url.rstrip('/')
+                # Only include same-domain links
+                if parsed_url.netloc == parsed_base.netloc:
+                    # Clean URL (remove anchors and query params for deduplication)
+                    clean_url = (
+                        f'{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}'
+                    )
+                    clean_url = clean_url.rstrip('/')
 
-                        if clean_url and clean_url not in links:
-                            links.add(clean_url)
+                    if clean_url:
+                        links.add(clean_url)
 
             # Convert to list and prioritize
             links_list = list(links)
@@ -438,31 +773,6 @@ class WebsiteScrapper(BaseScrapper):
         Returns:
             Sorted list with most relevant URLs first
         """
-        priority_keywords = [
-            'sobre',
-            'about',
-            'quem-somos',
-            'contato',
-            'contact',
-            'fale-conosco',
-            'servico',
-            'service',
-            'servicos',
-            'produto',
-            'product',
-            'produtos',
-            'empresa',
-            'company',
-        ]
-
-        def score_url(url):
-            path = urlparse(url).path.lower()
-            # Count keyword matches
-            matches = sum(1 for kw in priority_keywords if kw in path)
-            # Prefer shorter paths (closer to root)
-            depth_penalty = path.count('/') * 0.1
-            return matches - depth_penalty
-
         return sorted(links, key=score_url, reverse=True)
 
     def _discover_pages_common_paths(self, base_url: str) -> List[str]:
@@ -510,6 +820,91 @@ class WebsiteScrapper(BaseScrapper):
         # Limit to MAX_PAGES_PER_SITE
         return pages_to_fetch[:MAX_PAGES_PER_SITE]
 
+    def _fetch_all(
+        self,
+        urls: List[str],
+        fetcher: Optional[Callable[[str], Any]] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Fetch several URLs concurrently with a bounded worker pool.
+
+        Rate limiting is applied by the fetchers themselves, which take
+        tokens from the host's shared limiter per request they actually send.
+
+        Args:
+            urls: URLs to fetch
+            fetcher: Function applied to each URL (default: _fetch_page_content)
+
+        Returns:
+            List of (url, result) tuples in the same order as urls, with a
+            None result for any URL whose fetcher raised
+        """
+        if not urls:
+            return []
+
+        fetcher = fetcher or self._fetch_page_content
+
+        def fetch(indexed_url: Tuple[int, str]) -> Tuple[str, Any]:
+            idx, url = indexed_url
+            logger.debug(f'Fetching URL ({idx + 1}/{len(urls)}): {url}')
+            try:
+                return url, fetcher(url)
+            except Exception as e:
+                # One bad page must not abort the rest of the batch
+                logger.error(f'Unexpected error fetching {url}: {str(e)}')
+                return url, None
+
+        max_workers = min(FETCH_MAX_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, enumerate(urls)))
+
+    def _probe_page_size(self, url: str) -> Optional[int]:
+        """
+        Measure a page's size for ranking without downloading it when possible.
+
+        Uses the Content-Length of a HEAD request when it describes the
+        uncompressed body. When the server does not report one, or the body is
+        content-encoded (the header then counts compressed bytes), the page is
+        downloaded instead (taking a full rate limit token) and its body cached
+        so the later fetch in collect_data does not hit the network again.
+
+        Args:
+            url: URL to probe
+
+        Returns:
+            Uncompressed body size in bytes, capped at PAGE_MAX_BYTES
+            (downloaded pages are measured as UTF-8), or None if the page is
+            not accessible
+        """
+        if self._robots is not None and not self._robots.can_fetch(USER_AGENT, url):
+            return None
+
+        _get_rate_limiter(urlparse(url).netloc).wait_for_token(PROBE_TOKEN_COST)
+        try:
+            response = self._session.head(
+                url, timeout=self.timeout, allow_redirects=True
+            )
+            # A Content-Length for an encoded body is the compressed size,
+            # which would rank the page below uncompressed ones
+            if response.status_code == 200 and not response.headers.get(
+                'Content-Encoding'
+            ):
+                content_length = int(response.headers.get('Content-Length') or 0)
+                if content_length > 0:
+                    return min(content_length, PAGE_MAX_BYTES)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f'HEAD request failed for {url}: {str(e)}')
+
+        # The fallback GET takes its own page-fetch token
+        html = self._fetch_page_content(url)
+        return len(html.encode('utf-8')) if html else None
+
+    def _record_fetch(self, success: bool) -> None:
+        """Increment the fetched/failed page counters under the stats lock."""
+        key = 'pages_fetched' if success else 'pages_failed'
+        with self._stats_lock:
+            self.ensamble[key] += 1
+
     def _fetch_page_content(self, url: str) -> Optional[str]:
         """
         Fetch HTML content from a URL with politeness measures.
@@ -520,49 +915,92 @@ class WebsiteScrapper(BaseScrapper):
         Returns:
             HTML content as string, or None if failed
         """
-        try:
-            headers = {
-                'User-Agent': USER_AGENT,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9',
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
+        if self._robots is not None and not self._robots.can_fetch(USER_AGENT, url):
+            logger.debug(f'Skipping {url}: disallowed by robots.txt')
+            return None
 
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=self.timeout,
-                allow_redirects=True,
-                verify=True,
+        cached = self._body_cache.get(url)
+        if cached is not None:
+            self._record_fetch(True)
+            logger.debug(f'Using cached content for: {url}')
+            return cached
+
+        # Only requests that reach the network take a page-fetch token
+        _get_rate_limiter(urlparse(url).netloc).wait_for_token()
+        try:
+            response = self._session.get(
+                url, timeout=self.timeout, allow_redirects=True, stream=True
             )
 
-            # Check status code
-            if response.status_code == 200:
-                self.ensamble['pages_fetched'] += 1
-                logger.debug(f'Successfully fetched: {url}')
-                return response.text
-            else:
-                logger.warning(f'Failed to fetch {url}: HTTP {response.status_code}')
-                self.ensamble['pages_failed'] += 1
-                return None
+            try:
+                # Check status code
+                if response.status_code == 200:
+                    html = self._read_capped_body(response, url)
+                    self._record_fetch(True)
+                    logger.debug(f'Successfully fetched: {url}')
+                    self._body_cache[url] = html
+                    return html
+                else:
+                    logger.warning(
+                        f'Failed to fetch {url}: HTTP {response.status_code}'
+                    )
+                    self._record_fetch(False)
+                    return None
+            finally:
+                response.close()
 
         except requests.exceptions.Timeout:
             logger.warning(f'Timeout fetching {url}')
-            self.ensamble['pages_failed'] += 1
+            self._record_fetch(False)
             return None
         except requests.exceptions.RequestException as e:
             logger.warning(f'Request error fetching {url}: {str(e)}')
-            self.ensamble['pages_failed'] += 1
+            self._record_fetch(False)
             return None
         except Exception as e:
             logger.error(f'Unexpected error fetching {url}: {str(e)}')
-            self.ensamble['pages_failed'] += 1
+            self._record_fetch(False)
             return None
 
+    @staticmethod
+    def _read_capped_body(response: requests.Response, url: str) -> str:
+        """
+        Read a streamed response body, stopping after PAGE_MAX_BYTES.
+
+        Oversized pages (e.g. product catalogs) rarely carry company info, so
+        reading stops at the cap instead of buffering and parsing megabytes.
+
+        Args:
+            response: Streamed response with a 200 status
+            url: Requested URL, used for logging
+
+        Returns:
+            Decoded (possibly truncated) body
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=PAGE_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= PAGE_MAX_BYTES:
+                logger.info(f'Truncated {url} at {PAGE_MAX_BYTES} bytes')
+                break
+
+        raw = b''.join(chunks)[:PAGE_MAX_BYTES]
+        try:
+            return raw.decode(response.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return raw.decode('utf-8', errors='replace')
+
     def _extract_text_from_html(self, html: str) -> str:
         """
-        Extract clean text from HTML using BeautifulSoup.
+        Extract clean text from HTML.
+
+        Parses with lxml directly and walks the text nodes, which avoids
+        building a BeautifulSoup tree for every page. Documents lxml refuses
+        (e.g. XHTML with an encoding declaration) fall back to BeautifulSoup.
+        Results are cached by a digest of the HTML, so identical bodies served
+        under several URLs are only parsed once.
 
         Args:
             html: Raw HTML content
@@ -570,26 +1008,134 @@ class WebsiteScrapper(BaseScrapper):
         Returns:
             Cleaned text content
         """
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Remove script and style elements
-            for script_or_style in soup(['script', 'style', 'noscript']):
-                script_or_style.decompose()
+        key = hashlib.blake2b(
+            html.encode('utf-8', errors='replace'), digest_size=16
+        ).digest()
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            return cached
 
-            # Get text
-            text = soup.get_text(separator='\n', strip=True)
+        try:
+            try:
+                root = lxml.html.fromstring(html)
+                # Remove comments, script and style elements (keeping tails)
+                etree.strip_elements(
+                    root, etree.Comment, 'script', 'style', 'noscript', with_tail=False
+                )
+                text = '\n'.join(
+                    chunk.strip() for chunk in root.itertext() if chunk.strip()
+                )
+            except (ValueError, etree.ParserError):
+                soup = BeautifulSoup(html, 'lxml')
+                for script_or_style in soup(['script', 'style', 'noscript']):
+                    script_or_style.decompose()
+                text = soup.get_text(separator='\n', strip=True)
 
             # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split('  '))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-
+            text = _WHITESPACE_RE.sub('\n', text).strip()
+            self._text_cache[key] = text
             return text
         except Exception as e:
             logger.error(f'Error extracting text from HTML: {str(e)}')
             return ''
 
+    @staticmethod
+    def _strip_boilerplate(texts: List[str]) -> List[str]:
+        """
+        Remove lines repeated across most pages, keeping their first occurrence.
+
+        Header, footer and navigation text is usually repeated on every page.
+        Lines found on at least BOILERPLATE_PAGE_RATIO of the pages (and on at
+        least two) are kept on the first page they appear on and dropped from
+        the others, so contact details in a shared footer still reach the LLM
+        once. Consecutive duplicate lines within a page are collapsed too.
+
+        Args:
+            texts: Extracted page texts
+
+        Returns:
+            Page texts with repeated boilerplate removed, in the same order
+        """
+        pages_lines = [text.splitlines() for text in texts]
+        line_counts = Counter(line for lines in pages_lines for line in set(lines))
+        threshold = max(2, math.ceil(len(texts) * BOILERPLATE_PAGE_RATIO))
+        common = {line for line, count in line_counts.items() if count >= threshold}
+
+        seen_common = set()
+        cleaned = []
+        for lines in pages_lines:
+            kept = []
+            for line in lines:
+                if kept and kept[-1] == line:
+                    continue
+                if line in common:
+                    if line in seen_common:
+                        continue
+                    seen_common.add(line)
+                kept.append(line)
+            cleaned.append('\n'.join(kept))
+
+        return cleaned
+
+    @staticmethod
+    def _allocate_text_budget(texts: List[str], total_budget: int) -> List[int]:
+        """
+        Split a character budget across page texts by informational weight.
+
+        Pages that fit in an equal or weighted share are kept whole and the
+        leftover is redistributed among the remaining pages. Pages that do
+        not fit are truncated in proportion to their length times their
+        type/token ratio, so long repetitive pages get less room than varied
+        ones.
+
+        Args:
+            texts: Extracted page texts
+            total_budget: Total number of characters to allocate
+
+        Returns:
+            Character budget for each text, in the same order
+        """
+        budgets = [0] * len(texts)
+        scores = []
+        for text in texts:
+            words = text.split()
+            ratio = len(set(words)) / len(words) if words else 0.0
+            scores.append(max(ratio * len(text), 1.0))
+
+        active = [i for i, text in enumerate(texts) if text]
+        remaining = total_budget
+        while active and remaining > 0:
+            total_score = sum(scores[i] for i in active)
+            shares = {i: remaining * scores[i] / total_score for i in active}
+            equal_share = remaining / len(active)
+            fitting = [i for i in active if len(texts[i]) <= equal_share]
+            if not fitting:
+                fitting = [i for i in active if len(texts[i]) <= shares[i]]
+            if not fitting:
+                for i in active:
+                    budgets[i] = int(shares[i])
+                break
+            for i in fitting:
+                budgets[i] = len(texts[i])
+                remaining -= budgets[i]
+            active = [i for i in active if i not in fitting]
+
+        return budgets
+
+    @staticmethod
+    def _text_fingerprint(text: str) -> bytes:
+        """
+        Compute a fingerprint of page text that ignores dates, times and whitespace.
+
+        Args:
+            text: Extracted page text
+
+        Returns:
+            16-byte blake2b digest of the stripped text
+        """
+        stripped = _FINGERPRINT_STRIP_RE.sub('', text)
+        return hashlib.blake2b(stripped.encode('utf-8'), digest_size=16).digest()
+
     def _extract_structured_data(self, pages_content: Dict[str, str]) -> Dict:
         """
         Extract structured data from HTML pages using Google Gemini LLM.
@@ -604,35 +1150,39 @@ class WebsiteScrapper(BaseScrapper):
             f'Extracting structured data using Gemini LLM from {len(pages_content)} pages'
         )
 
-        # Combine all page texts
-        all_text = []
+        # Collect page texts, skipping near-identical pages
+        page_texts = []
+        seen_fingerprints = set()
         for url, html in pages_content.items():
             text = self._extract_text_from_html(html)
-            if text:
-                all_text.append(
-                    f'=== Page: {url} ===\n{text[:20000]}'
-                )  # Limit per page
+            if not text:
+                continue
 
-        combined_text = '\n\n'.join(all_text)[:300000]  # Limit total to ~300k chars
+            fingerprint = self._text_fingerprint(text)
+            if fingerprint in seen_fingerprints:
+                logger.debug(f'Skipping duplicate page content: {url}')
+                continue
+            seen_fingerprints.add(fingerprint)
+            page_texts.append((url, text))
+
+        # Keep shared header/footer/nav lines only on the first page
+        texts = self._strip_boilerplate([text for _, text in page_texts])
+        removed_chars = sum(len(text) for _, text in page_texts) - sum(map(len, texts))
+        if removed_chars:
+            logger.info(f'Removed {removed_chars} chars of repeated boilerplate')
+        page_texts = [(url, text) for (url, _), text in zip(page_texts, texts)]
+
+        # Share the prompt budget across pages by informational weight
+        budgets = self._allocate_text_budget(texts, PROMPT_TEXT_CHAR_BUDGET)
+        combined_text = '\n\n'.join(
+            f'=== Page: {url} ===\n{text[:budget]}'
+            for (url, text), budget in zip(page_texts, budgets)
+        )
 
         if not combined_text.strip():
             logger.warning('No text content extracted from pages')
             return {}
 
-        # Load JSON schema for Gemini response from external file
-        schema_path = os.path.join(
-            os.path.dirname(__file__), 'website_gemini_schema.json'
-        )
-        try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                response_schema = json.load(f)
-        except FileNotFoundError:
-            logger.error(f'Schema file not found: {schema_path}')
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f'Invalid JSON in schema file: {str(e)}')
-            return {}
-
         # Construct prompt for Gemini
         prompt = f"""Analyze the following website content and extract structured company information in Brazilian Portuguese context.
 
@@ -665,12 +1215,6 @@ Return ONLY valid JSON following the schema provided."""
         try:
             # Use Gemini to extract structured data with JSON schema
             logger.info('Calling Gemini API for structured extraction...')
-            self.gemini_handler = GoogleGeminiHandler(
-                api_key=self.gemini_api_key,
-                temperature=0.0,
-                response_mime_type='application/json',
-                response_schema=response_schema,
-            )
             result = self.gemini_handler.generate_output(prompt=prompt)
 
             # Parse JSON response
@@ -765,7 +1309,7 @@ Return ONLY valid JSON following the schema provided."""
                 return
 
             region = os.environ.get('AWS_REGION_NAME', settings.region)
-            sqs_client = boto3.client('sqs', region_name=region)
+            sqs_client = get_boto_client('sqs', region)
             message_body = json.dumps(
                 {
                     'company_id': company_id,
@@ -789,6 +1333,11 @@ Return ONLY valid JSON following the schema provided."""
             )
             # Don't fail the entire scraping process if SQS fails
 
+    def close(self) -> None:
+        """Close the HTTP session and wait for queued side tasks."""
+        self._session.close()
+        self._io_executor.shutdown(wait=True)
+
     def collect_data(self) -> None:
         """
         Main method to orchestrate website scraping and data extraction.
@@ -822,16 +1371,10 @@ Return ONLY valid JSON following the schema provided."""
             pages_to_fetch = self._discover_pages(self.website)
             logger.info(f'Discovered {len(pages_to_fetch)} pages to fetch')
 
-            # Fetch page contents with rate limiting
+            # Fetch page contents concurrently under the per-host rate limit
             pages_content = {}
-            for idx, url in enumerate(pages_to_fetch):
-                # Rate limiting: delay between requests
-                if idx > 0:
-                    delay = random.uniform(MIN_DELAY_SECONDS, MAX_DELAY_SECONDS)
-                    logger.debug(f'Rate limiting: sleeping {delay:.2f}s')
-                    time.sleep(delay)
-
-                html = self._fetch_page_content(url)
+            fetched = self._fetch_all(pages_to_fetch)
+            for url, html in fetched:
                 if html:
                     pages_content[url] = html
 
@@ -872,13 +1415,6 @@ Return ONLY valid JSON following the schema provided."""
                     'status_reason'
                 ] = 'Failed to extract structured data from pages'
 
-            # Save to database
-            save_success = self._save_to_database(website_data)
-
-            if not save_success:
-                # Status already updated in _save_to_database
-                pass
-
             # Queue federal scraping if CNPJ was extracted
             if website_data and website_data.get('cnpj'):
                 from src.shared.utils import clean_cnpj, validate_cnpj
@@ -890,12 +1426,24 @@ Return ONLY valid JSON following the schema provided."""
                     logger.info(
                         f'Valid CNPJ found: {extracted_cnpj}, queueing federal scraping'
                     )
-                    self._queue_federal_scraping_task(self.company_id, cleaned_cnpj)
+                    # Sent in the background while the enriched data is saved
+                    self._io_executor.submit(
+                        self._queue_federal_scraping_task,
+                        self.company_id,
+                        cleaned_cnpj,
+                    )
                 else:
                     logger.warning(
                         f'Invalid CNPJ extracted: {extracted_cnpj}, skipping federal scraping'
                     )
 
+            # Save to database
+            save_success = self._save_to_database(website_data)
+
+            if not save_success:
+                # Status already updated in _save_to_database
+                pass
+
             logger.info(
                 f'Website scraping completed - Status: {self.ensamble["status"]}, '
                 f'Reason: {self.ensamble["status_reason"]}'
@@ -913,3 +1461,5 @@ Return ONLY valid JSON following the schema provided."""
             self.ensamble['status'] = 'failed'
             self.ensamble['status_reason'] = f'Scraping error: {str(e)}'
             self._save_to_database({})
+        finally:
+            self.close()
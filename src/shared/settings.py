@@ -6,22 +6,38 @@ across the entire backend-core project, supporting both dev and prod environment
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, Optional
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
 # Locate .env file from the project root (find parent directory containing backend-core structure)
 _current_dir = Path(__file__).resolve().parent  # src/shared
 _project_root = _current_dir.parent.parent  # Go up to project root
 _env_file = _project_root / '.env'
 
-if _env_file.exists():
-    load_dotenv(_env_file, override=True)
-else:
-    # Fallback to current working directory
-    load_dotenv(override=True)
+
+def _load_env_file() -> None:
+    """
+    Load environment variables from the project .env file for local runs.
+
+    Skipped inside AWS Lambda (the runtime sets AWS_LAMBDA_FUNCTION_NAME and
+    all variables come from the function configuration) or when SKIP_DOTENV
+    is set, saving the file lookup and parsing on every cold start.
+    """
+    if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') or os.environ.get('SKIP_DOTENV'):
+        return
+
+    if _env_file.exists():
+        load_dotenv(_env_file, override=True)
+    else:
+        # Fallback to current working directory
+        load_dotenv(override=True)
+
+
+# Load environment variables from .env file
+_load_env_file()
 
 
 class Settings:
@@ -31,8 +47,12 @@ class Settings:
     Automatically detects the environment stage (dev/prod) and provides
     dynamic resource names, API keys, and configuration values.
 
+    Values are read from the environment on first access and cached on the
+    instance, since the environment does not change during a Lambda's life.
+
     Attributes:
         stage: Current deployment stage ('dev' or 'prod')
+        stage_suffix: Upper-case stage used in stage-specific variable names
         region: AWS region
         account_id: AWS account ID
     """
@@ -44,6 +64,8 @@ class Settings:
         self.stage = os.environ.get('STAGE', 'dev').lower()
         self.region = os.environ.get('REGION', 'us-east-1')
         self.account_id = os.environ.get('ACCOUNT_ID', '')
+        # Suffix of stage-specific variables, e.g. GEMINI_API_KEY_DEV
+        self.stage_suffix = self.stage.upper()
 
         # Validate stage
         if self.stage not in self.VALID_STAGES:
@@ -52,22 +74,22 @@ class Settings:
             )
 
     # DynamoDB Table Names
-    @property
+    @cached_property
     def companies_table_name(self) -> str:
         """Get the companies DynamoDB table name for current stage."""
         return os.environ.get('COMPANIES_TABLE', f'{self.stage}-auris-core-companies')
 
-    @property
+    @cached_property
     def places_table_name(self) -> str:
         """Get the places DynamoDB table name for current stage."""
         return os.environ.get('PLACES_TABLE', f'{self.stage}-auris-core-places')
 
-    @property
+    @cached_property
     def leads_table_name(self) -> str:
         """Get the leads DynamoDB table name for current stage."""
         return os.environ.get('LEADS_TABLE', f'{self.stage}-auris-core-leads')
 
-    @property
+    @cached_property
     def communication_history_table_name(self) -> str:
         """Get the communication history DynamoDB table name for current stage."""
         return os.environ.get(
@@ -75,7 +97,7 @@ class Settings:
             f'{self.stage}-auris-core-communication-history',
         )
 
-    @property
+    @cached_property
     def import_status_table_name(self) -> str:
         """Get the import status DynamoDB table name for current stage."""
         return os.environ.get(
@@ -83,7 +105,7 @@ class Settings:
             f'{self.stage}-auris-core-import-status',
         )
 
-    @property
+    @cached_property
     def auth_codes_table_name(self) -> str:
         """Get the authentication codes DynamoDB table name for current stage."""
         return os.environ.get(
@@ -91,7 +113,7 @@ class Settings:
             f'{self.stage}-auris-auth-codes',
         )
 
-    @property
+    @cached_property
     def users_table_name(self) -> str:
         """Get the company users DynamoDB table name for current stage."""
         return os.environ.get(
@@ -127,48 +149,48 @@ class Settings:
             )
 
     # SQS Queue Configuration
-    @property
+    @cached_property
     def scraper_task_queue_url(self) -> str:
         """Get the scraper task queue URL."""
         return os.environ.get('SCRAPER_TASK_QUEUE_URL', '')
 
-    @property
+    @cached_property
     def scraper_task_queue_name(self) -> str:
         """Get the scraper task queue name for current stage."""
         return f'backend-core-{self.stage}-scraper-tasks'
 
-    @property
+    @cached_property
     def website_scraper_task_queue_url(self) -> str:
         """Get the website scraper task queue URL."""
         return os.environ.get('WEBSITE_SCRAPER_TASK_QUEUE_URL', '')
 
-    @property
+    @cached_property
     def website_scraper_task_queue_name(self) -> str:
         """Get the website scraper task queue name for current stage."""
         return f'backend-core-{self.stage}-website-scraper-tasks'
 
-    @property
+    @cached_property
     def company_federal_scraper_task_queue_url(self) -> str:
         """Get the company federal scraper task queue URL."""
         return os.environ.get('COMPANY_FEDERAL_SCRAPER_TASK_QUEUE_URL', '')
 
-    @property
+    @cached_property
     def company_federal_scraper_task_queue_name(self) -> str:
         """Get the company federal scraper task queue name for current stage."""
         return f'backend-core-{self.stage}-company-federal-scraper-tasks'
 
-    @property
+    @cached_property
     def operations_queue_url(self) -> str:
         """Get the operations queue URL for hub lambda routing."""
         return os.environ.get('OPERATIONS_QUEUE_URL', '')
 
-    @property
+    @cached_property
     def operations_queue_name(self) -> str:
         """Get the operations queue name for current stage."""
         return f'backend-core-{self.stage}-gl-operations-queue'
 
     # Google Places API Configuration
-    @property
+    @cached_property
     def google_places_api_key(self) -> str:
         """
         Get the Google Places API key for current stage.
@@ -176,7 +198,7 @@ class Settings:
         Returns:
             API key for the current environment (dev or prod)
         """
-        env_key = f'GOOGLE_PLACES_API_KEY_{self.stage.upper()}'
+        env_key = f'GOOGLE_PLACES_API_KEY_{self.stage_suffix}'
         api_key = os.environ.get(env_key, '')
 
         if not api_key:
@@ -184,7 +206,7 @@ class Settings:
 
         return api_key
 
-    @property
+    @cached_property
     def google_places_daily_quota_limit(self) -> int:
         """
         Get the Google Places API daily quota limit for current stage.
@@ -193,7 +215,7 @@ class Settings:
             Daily quota limit (default varies by stage: dev=10000, prod=20000)
         """
         # Try stage-specific quota first
-        env_key = f'GOOGLE_PLACES_DAILY_QUOTA_LIMIT_{self.stage.upper()}'
+        env_key = f'GOOGLE_PLACES_DAILY_QUOTA_LIMIT_{self.stage_suffix}'
         quota_str = os.environ.get(env_key)
 
         if quota_str:
@@ -207,8 +229,22 @@ class Settings:
 
         return default_quotas.get(self.stage, 10000)
 
+    @cached_property
+    def google_places_fetch_details(self) -> bool:
+        """
+        Check whether Place Details should be fetched for every search result.
+
+        Text Search already returns the fields we persist except reviews and
+        regular opening hours, so details are skipped unless explicitly enabled.
+
+        Returns:
+            True if GOOGLE_PLACES_FETCH_DETAILS is enabled (default: False)
+        """
+        value = os.environ.get('GOOGLE_PLACES_FETCH_DETAILS', 'false')
+        return value.strip().lower() in ('1', 'true', 'yes')
+
     # Google Gemini API Configuration
-    @property
+    @cached_property
     def gemini_api_key(self) -> str:
         """
         Get the Google Gemini API key for current stage.
@@ -216,7 +252,7 @@ class Settings:
         Returns:
             API key for the current environment (dev or prod)
         """
-        env_key = f'GEMINI_API_KEY_{self.stage.upper()}'
+        env_key = f'GEMINI_API_KEY_{self.stage_suffix}'
         api_key = os.environ.get(env_key, '')
 
         if not api_key:
@@ -225,7 +261,7 @@ class Settings:
         return api_key
 
     # AWS Cognito Configuration
-    @property
+    @cached_property
     def cognito_user_pool_id(self) -> str:
         """
         Get the Cognito User Pool ID for current stage.
@@ -233,7 +269,7 @@ class Settings:
         Returns:
             User Pool ID for the current environment (dev or prod)
         """
-        env_key = f'COGNITO_USER_POOL_ID_{self.stage.upper()}'
+        env_key = f'COGNITO_USER_POOL_ID_{self.stage_suffix}'
         pool_id = os.environ.get(env_key, '')
 
         if not pool_id:
@@ -241,7 +277,7 @@ class Settings:
 
         return pool_id
 
-    @property
+    @cached_property
     def cognito_user_pool_id_dev(self) -> Optional[str]:
         """
         Get the Cognito User Pool ID for dev stage.
@@ -251,7 +287,7 @@ class Settings:
         """
         return os.environ.get('COGNITO_USER_POOL_ID_DEV', '')
 
-    @property
+    @cached_property
     def cognito_user_pool_id_prod(self) -> Optional[str]:
         """
         Get the Cognito User Pool ID for prod stage.
@@ -261,7 +297,7 @@ class Settings:
         """
         return os.environ.get('COGNITO_USER_POOL_ID_PROD', '')
 
-    @property
+    @cached_property
     def cognito_app_client_id_dev(self) -> str:
         """
         Get the Cognito App Client ID for dev stage.
@@ -279,7 +315,7 @@ class Settings:
             )
         return client_id
 
-    @property
+    @cached_property
     def cognito_app_client_id_prod(self) -> str:
         """
         Get the Cognito App Client ID for prod stage.
@@ -297,7 +333,7 @@ class Settings:
             )
         return client_id
 
-    @property
+    @cached_property
     def cognito_app_client_secret_dev(self) -> Optional[str]:
         """
         Get the Cognito App Client Secret for dev stage (optional).
@@ -307,7 +343,7 @@ class Settings:
         """
         return os.environ.get('COGNITO_APP_CLIENT_SECRET_DEV', '')
 
-    @property
+    @cached_property
     def cognito_app_client_secret_prod(self) -> Optional[str]:
         """
         Get the Cognito App Client Secret for prod stage (optional).
@@ -318,7 +354,7 @@ class Settings:
         return os.environ.get('COGNITO_APP_CLIENT_SECRET_PROD', '')
 
     # AWS SES Configuration
-    @property
+    @cached_property
     def ses_from_email(self) -> str:
         """
         Get the SES from email address for current stage.
@@ -326,7 +362,7 @@ class Settings:
         Returns:
             SES email address for the current environment
         """
-        env_key = f'SES_FROM_EMAIL_{self.stage.upper()}'
+        env_key = f'SES_FROM_EMAIL_{self.stage_suffix}'
         from_email = os.environ.get(env_key, '')
 
         if not from_email:
@@ -335,17 +371,17 @@ class Settings:
         return from_email
 
     # Authentication Configuration
-    @property
+    @cached_property
     def auth_code_validity_minutes(self) -> int:
         """Get the authentication code validity period in minutes."""
         return int(os.environ.get('AUTH_CODE_VALIDITY_MINUTES', '5'))
 
-    @property
+    @cached_property
     def auth_code_max_attempts(self) -> int:
         """Get the maximum number of code verification attempts."""
         return int(os.environ.get('AUTH_CODE_MAX_ATTEMPTS', '3'))
 
-    @property
+    @cached_property
     def auth_code_length(self) -> int:
         """Get the authentication code length."""
         return int(os.environ.get('AUTH_CODE_LENGTH', '6'))
@@ -386,5 +422,16 @@ class Settings:
         )
 
 
-# Global settings instance for easy import
-settings = Settings()
+# Global settings instance for easy import, built on first access so modules
+# that only need the Settings class skip the constructor
+_settings: Optional[Settings] = None
+
+
+def __getattr__(name: str) -> Settings:
+    """Create the global ``settings`` instance lazily (PEP 562)."""
+    global _settings
+    if name == 'settings':
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,18 +1,123 @@
 import json
 import re
+import threading
+import time
+from functools import lru_cache
 from http import HTTPStatus
+from operator import mul
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from auris_tools.databaseHandlers import DatabaseHandler
-
-from src.shared.settings import settings
+# boto3 (pulled in by auris_tools) is imported on first use so handlers that
+# never reach AWS do not pay for it on cold start
+if TYPE_CHECKING:
+    from auris_tools.databaseHandlers import DatabaseHandler
 
 # Collect the valid users sources from settings
 VALID_USERS_PATH = Path(__file__).parent / 'valid_users.json'
 with open(VALID_USERS_PATH, 'r') as f:
     VALID_USERS = json.load(f)
 
+# Strips formatting (and any non-ASCII digit) from CNPJ and phone numbers
+_NON_DIGIT_RE = re.compile(r'\D', re.ASCII)
+
+# CNPJ check digit weights
+_CNPJ_FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_SECOND_WEIGHTS = (6,) + _CNPJ_FIRST_WEIGHTS
+
+# Companies confirmed to exist, mapped to the monotonic time of the lookup.
+# Bulk imports send one add_new_lead invocation per row for the same company,
+# so warm containers skip the repeated GetItem. Misses are never cached.
+_COMPANY_EXISTS_CACHE: Dict[str, float] = {}
+COMPANY_EXISTS_CACHE_TTL_SECONDS = 60
+
+# Leads GSI used for per-company duplicate phone lookups
+LEADS_PHONE_INDEX = 'companyID-phone-index'
+LEADS_PHONE_KEY_CONDITION = 'companyID = :company_id AND phone = :phone'
+
+# botocore Config options: larger pool for threaded callers, TCP keep-alive
+# so idle pooled connections survive between invocations, adaptive retries
+BOTO_CLIENT_CONFIG = {
+    'max_pool_connections': 50,
+    'tcp_keepalive': True,
+    'connect_timeout': 5,
+    'retries': {'max_attempts': 3, 'mode': 'adaptive'},
+}
+
+# boto3 clients shared across invocations of a warm Lambda container,
+# keyed by (service_name, region_name)
+_BOTO_CLIENTS: Dict[Tuple[str, Optional[str]], Any] = {}
+_BOTO_CLIENTS_LOCK = threading.Lock()
+
+
+def get_boto_client(service_name: str, region_name: Optional[str] = None) -> Any:
+    """
+    Return a cached boto3 client, creating it on first use.
+
+    Building a client parses the service model and sets up a connection pool,
+    which costs tens of milliseconds. boto3 clients are thread-safe, so one
+    instance per service and region, created from the default session with
+    BOTO_CLIENT_CONFIG, is reused for the container lifetime.
+
+    Args:
+        service_name: AWS service name (e.g. 'sqs', 's3', 'lambda')
+        region_name: AWS region, or None for the default session region
+
+    Returns:
+        boto3 client for the service
+    """
+    key = (service_name, region_name)
+    client = _BOTO_CLIENTS.get(key)
+    if client is None:
+        with _BOTO_CLIENTS_LOCK:
+            client = _BOTO_CLIENTS.get(key)
+            if client is None:
+                import boto3
+                from botocore.config import Config
+
+                client = boto3.client(
+                    service_name,
+                    region_name=region_name,
+                    config=Config(**BOTO_CLIENT_CONFIG),
+                )
+                _BOTO_CLIENTS[key] = client
+    return client
+
+
+def _digits_only(value: str) -> str:
+    """
+    Strip every character that is not an ASCII digit.
+
+    Values that are already plain digits (the usual case after upstream
+    cleaning) are returned as-is without running the regex.
+
+    Args:
+        value: String that may contain formatting
+
+    Returns:
+        ASCII digits of the value
+    """
+    if value.isascii() and value.isdigit():
+        return value
+    return _NON_DIGIT_RE.sub('', value)
+
+
+def _cnpj_check_digit(digits: bytes, weights: Tuple[int, ...]) -> int:
+    """
+    Calculate a CNPJ check digit.
+
+    Args:
+        digits: ASCII-encoded CNPJ digits (only the first len(weights) are used)
+        weights: Check digit weights
+
+    Returns:
+        Check digit (0-9)
+    """
+    # map/mul runs in C; subtract the ASCII '0' offset in one step
+    total = sum(map(mul, digits, weights)) - 48 * sum(weights)
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
 
 def validate_cnpj(cnpj: str) -> bool:
     """
@@ -28,35 +133,24 @@ def validate_cnpj(cnpj: str) -> bool:
         return False
 
     # Remove formatting characters
-    cnpj_digits = re.sub(r'[^\d]', '', cnpj)
+    cnpj_digits = _digits_only(cnpj)
 
     # Check if has 14 digits
     if len(cnpj_digits) != 14:
         return False
 
     # Check if all digits are the same (invalid CNPJ)
-    if cnpj_digits == cnpj_digits[0] * 14:
+    if cnpj_digits.count(cnpj_digits[0]) == 14:
         return False
 
-    # Validate check digits
-    def calculate_check_digit(cnpj_partial: str, weights: list) -> int:
-        """Calculate CNPJ check digit."""
-        total = sum(int(digit) * weight for digit, weight in zip(cnpj_partial, weights))
-        remainder = total % 11
-        return 0 if remainder < 2 else 11 - remainder
-
-    # First check digit
-    weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    first_check = calculate_check_digit(cnpj_digits[:12], weights_first)
-
-    if int(cnpj_digits[12]) != first_check:
+    # Validate check digits on the ASCII codes (ord('0') == 48)
+    digits = cnpj_digits.encode('ascii')
+    first_check = _cnpj_check_digit(digits, _CNPJ_FIRST_WEIGHTS)
+    if digits[12] - 48 != first_check:
         return False
 
-    # Second check digit
-    weights_second = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    second_check = calculate_check_digit(cnpj_digits[:13], weights_second)
-
-    return int(cnpj_digits[13]) == second_check
+    second_check = _cnpj_check_digit(digits, _CNPJ_SECOND_WEIGHTS)
+    return digits[13] - 48 == second_check
 
 
 def clean_cnpj(cnpj: str) -> Optional[str]:
@@ -73,7 +167,7 @@ def clean_cnpj(cnpj: str) -> Optional[str]:
         return None
 
     # Remove all non-digit characters
-    cnpj_digits = re.sub(r'[^\d]', '', cnpj)
+    cnpj_digits = _digits_only(cnpj)
 
     # Validate length
     if len(cnpj_digits) != 14:
@@ -96,7 +190,7 @@ def normalize_phone(phone: str) -> str:
         ValueError: If phone length is not between 1-15 digits
     """
     # Strip all non-digit characters
-    normalized = re.sub(r'\D', '', phone)
+    normalized = _digits_only(phone)
 
     # Validate length
     if not normalized or len(normalized) < 1 or len(normalized) > 15:
@@ -120,14 +214,14 @@ def normalize_string(text: str) -> str:
     if not text:
         return ''
 
-    # Convert to lowercase and strip leading/trailing whitespace
-    # Also collapse multiple spaces into single space
-    return ' '.join(text.lower().strip().split())
+    # Convert to lowercase; split() with no separator also drops leading and
+    # trailing whitespace and collapses runs, so no separate strip() is needed
+    return ' '.join(text.lower().split())
 
 
 def calculate_levenshtein_distance(s1: str, s2: str) -> int:
     """
-    Calculate Levenshtein distance between two strings using dynamic programming.
+    Calculate Levenshtein distance between two strings.
 
     The Levenshtein distance is the minimum number of single-character edits
     (insertions, deletions, or substitutions) required to change one string into another.
@@ -139,60 +233,148 @@ def calculate_levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         Integer distance between the strings
     """
+    # Shared prefixes and suffixes never add edits; drop them first
+    if s1 and s2:
+        limit = min(len(s1), len(s2))
+        start = 0
+        while start < limit and s1[start] == s2[start]:
+            start += 1
+        end = 0
+        while end < limit - start and s1[-1 - end] == s2[-1 - end]:
+            end += 1
+        s1 = s1[start : len(s1) - end]
+        s2 = s2[start : len(s2) - end]
+
     # Handle empty strings
     if not s1:
         return len(s2)
     if not s2:
         return len(s1)
 
-    # Create matrix with dimensions (len(s1)+1) x (len(s2)+1)
-    rows = len(s1) + 1
-    cols = len(s2) + 1
-    matrix = [[0 for _ in range(cols)] for _ in range(rows)]
-
-    # Initialize first column (transform s1 to empty string)
-    for i in range(rows):
-        matrix[i][0] = i
-
-    # Initialize first row (transform empty string to s2)
-    for j in range(cols):
-        matrix[0][j] = j
-
-    # Fill matrix using dynamic programming
-    for i in range(1, rows):
-        for j in range(1, cols):
-            # Cost of substitution (0 if characters match, 1 if different)
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-
-            matrix[i][j] = min(
-                matrix[i - 1][j] + 1,  # Deletion
-                matrix[i][j - 1] + 1,  # Insertion
-                matrix[i - 1][j - 1] + cost,  # Substitution
-            )
-
-    return matrix[rows - 1][cols - 1]
-
-
-def calculate_similarity_ratio(s1: str, s2: str, normalize: bool = True) -> float:
+    # Myers/Hyyrö bit-parallel algorithm: each column of the DP matrix is
+    # encoded as vertical +1/-1 delta bit vectors (Python ints, so any length
+    # works), turning the O(n*m) cell loop into O(n) integer operations.
+    # The shorter string is the pattern to keep the bit vectors small.
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+
+    pattern_len = len(s1)
+    match_masks: Dict[str, int] = {}
+    for i, char in enumerate(s1):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+
+    mask = (1 << pattern_len) - 1
+    last_bit = 1 << (pattern_len - 1)
+    positive_v = mask  # Vertical +1 deltas (first column is 0..m)
+    negative_v = 0  # Vertical -1 deltas
+    distance = pattern_len
+
+    for char in s2:
+        eq = match_masks.get(char, 0)
+        xv = eq | negative_v
+        xh = (((eq & positive_v) + positive_v) ^ positive_v) | eq
+        positive_h = (negative_v | ~(xh | positive_v)) & mask
+        negative_h = positive_v & xh
+
+        # Track the bottom cell, which holds the distance for this prefix
+        if positive_h & last_bit:
+            distance += 1
+        elif negative_h & last_bit:
+            distance -= 1
+
+        # Shift in the first row (D[0][j] = j grows by 1 each column)
+        positive_h = ((positive_h << 1) | 1) & mask
+        negative_h = (negative_h << 1) & mask
+        positive_v = (negative_h | ~(xv | positive_h)) & mask
+        negative_v = positive_h & xv
+
+    return distance
+
+
+def calculate_similarity_ratio(
+    s1: str, s2: str, normalize: bool = True, min_ratio: float = 0.0
+) -> Optional[float]:
     """
     Calculate similarity ratio between two strings using Levenshtein distance.
 
     Returns a percentage (0-100) where 100 means identical strings and 0 means
     completely different. Automatically normalizes strings before comparison.
+    Ratios are memoized per (normalized) pair, so repeated comparisons in a
+    warm Lambda, such as a new name against existing companies, are lookups.
 
     Args:
         s1: First string
         s2: Second string
         normalize: Whether to normalize strings before comparison (default: True)
+        min_ratio: Ratio the caller compares against. When the length difference
+            alone rules it out, the distance is not computed
+            (default: 0.0, always compute)
 
     Returns:
-        Similarity ratio as percentage (0-100)
+        Similarity ratio as percentage (0-100), or None when the length
+        difference alone keeps the pair below min_ratio. None is not a ratio;
+        treat it as "cannot match"
     """
     # Normalize strings if requested
     if normalize:
         s1 = normalize_string(s1)
         s2 = normalize_string(s2)
 
+    # The distance is at least the length difference, which caps the ratio
+    max_len = max(len(s1), len(s2))
+    if max_len and min_ratio > 0:
+        upper_bound = ((max_len - abs(len(s1) - len(s2))) / max_len) * 100
+        if upper_bound < min_ratio:
+            return None
+
+    # The ratio is symmetric; order the pair so both orders share an entry
+    if s2 < s1:
+        s1, s2 = s2, s1
+
+    return _similarity_ratio(s1, s2)
+
+
+def calculate_similarity_ratios(
+    query: str, candidates: List[str], min_ratio: float = 0.0
+) -> List[Optional[float]]:
+    """
+    Calculate the similarity ratio of one string against many candidates.
+
+    Strings are normalized once up front, then each pair goes through
+    calculate_similarity_ratio.
+
+    Args:
+        query: String to compare
+        candidates: Strings to compare against
+        min_ratio: Passed to calculate_similarity_ratio for every pair
+
+    Returns:
+        Similarity ratios (0-100) in candidate order, with None for candidates
+        ruled out by length (see calculate_similarity_ratio)
+    """
+    query = normalize_string(query)
+    candidates = [normalize_string(candidate) for candidate in candidates]
+
+    return [
+        calculate_similarity_ratio(
+            query, candidate, normalize=False, min_ratio=min_ratio
+        )
+        for candidate in candidates
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _similarity_ratio(s1: str, s2: str) -> float:
+    """
+    Compute the similarity ratio of two already-normalized strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+
+    Returns:
+        Similarity ratio as percentage (0-100)
+    """
     # Handle empty strings
     if not s1 and not s2:
         return 100.0
@@ -229,19 +411,22 @@ def response(
             - headers (Dict[str, str]): Response headers (defaults to {"Content-Type": "application/json"} merged with any provided headers).
             - body (str): JSON-serialized representation of `message`.
     """
-    sc = int(status_code)
-    default_headers = {'Content-Type': 'application/json'}
+    # Plain ints (the common case) skip the int() conversion
+    sc = status_code if type(status_code) is int else int(status_code)
+    # Built in a single literal; callers may mutate it, so it is not shared
     if headers:
-        default_headers.update(headers)
+        response_headers = {'Content-Type': 'application/json', **headers}
+    else:
+        response_headers = {'Content-Type': 'application/json'}
 
     return {
         'statusCode': sc,
-        'headers': default_headers,
+        'headers': response_headers,
         'body': json.dumps(message),
     }
 
 
-def validate_company_exists(company_id: str, db_handler: DatabaseHandler) -> None:
+def validate_company_exists(company_id: str, db_handler: 'DatabaseHandler') -> None:
     """
     Validate that the company exists in the companies table.
 
@@ -252,14 +437,23 @@ def validate_company_exists(company_id: str, db_handler: DatabaseHandler) -> Non
     Raises:
         ValueError: If company does not exist
     """
+    checked_at = _COMPANY_EXISTS_CACHE.get(company_id)
+    if (
+        checked_at is not None
+        and time.monotonic() - checked_at < COMPANY_EXISTS_CACHE_TTL_SECONDS
+    ):
+        return
+
     result = db_handler.get_item(key={'companyID': company_id})
 
     if not result:
         raise ValueError(f"Company with ID '{company_id}' does not exist")
 
+    _COMPANY_EXISTS_CACHE[company_id] = time.monotonic()
+
 
 def check_duplicate_phone(
-    company_id: str, phone: str, db_handler: DatabaseHandler
+    company_id: str, phone: str, db_handler: 'DatabaseHandler'
 ) -> None:
     """
     Check for duplicate phone number within the same company using GSI.
@@ -272,13 +466,19 @@ def check_duplicate_phone(
     Raises:
         ValueError: If duplicate phone found or GSI is not available
     """
+    # Imported here to keep botocore out of this module's import time and to
+    # build the global settings only when a lookup actually runs
+    from botocore.exceptions import ClientError
+
+    from src.shared.settings import settings
+
     try:
         # Query the GSI using boto3 client (DatabaseHandler doesn't have a query method)
         # boto3 client uses PascalCase parameter names
         response = db_handler.client.query(
             TableName=settings.leads_table_name,
-            IndexName='companyID-phone-index',
-            KeyConditionExpression='companyID = :company_id AND phone = :phone',
+            IndexName=LEADS_PHONE_INDEX,
+            KeyConditionExpression=LEADS_PHONE_KEY_CONDITION,
             ExpressionAttributeValues={
                 ':company_id': {'S': company_id},
                 ':phone': {'S': phone},
@@ -295,18 +495,22 @@ def check_duplicate_phone(
         else:
             return {'status': HTTPStatus.OK, 'message': 'No duplicate phone found'}
 
-    except Exception as e:
-        # If GSI doesn't exist yet, provide clear error message
-        error_msg = str(e).lower()
-        if 'index' in error_msg or 'gsi' in error_msg or 'not found' in error_msg:
+    except ClientError as e:
+        # If GSI doesn't exist yet, provide clear error message. DynamoDB
+        # reports a missing index as a ValidationException naming the index;
+        # ResourceNotFoundException means the table itself is missing.
+        error = e.response.get('Error', {})
+        if (
+            error.get('Code') == 'ValidationException'
+            and 'index' in error.get('Message', '').lower()
+        ):
             raise ValueError(
-                "GSI 'companyID-phone-index' is not available. "
+                f"GSI '{LEADS_PHONE_INDEX}' is not available. "
                 'Please create the GSI on the leads table before using this endpoint. '
                 'See deployment documentation for manual GSI creation steps.'
             )
-        # Re-raise if it's a duplicate phone error
-        if 'already exists' in str(e):
-            raise
+        raise ValueError(f'Error checking for duplicate phone: {str(e)}')
+    except Exception as e:
         # Re-raise other unexpected errors
         raise ValueError(f'Error checking for duplicate phone: {str(e)}')
 
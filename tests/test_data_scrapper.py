@@ -10,7 +10,7 @@ This test file validates the data scrapper handler functionality including:
 import json
 import os
 import sys
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
@@ -19,6 +19,19 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 from src.functions.data_scrapper.gmaps_handler import _load_niches, gmaps_scrapper
 
+# Message body of a valid scraping task; variants are derived from it
+_SQS_BODY_TEMPLATE = {'city': 'SÃO PAULO', 'state': 'SP', 'niche': 'aasi'}
+
+
+def _without(key):
+    """Return a copy of the body template without ``key``."""
+    return {k: v for k, v in _SQS_BODY_TEMPLATE.items() if k != key}
+
+
+def _sqs_event(body):
+    """Build a single-record SQS event carrying ``body`` as JSON."""
+    return {'Records': [{'messageId': 'test-id', 'body': json.dumps(body)}]}
+
 
 # Fixtures
 @pytest.fixture
@@ -32,19 +45,10 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv('PLACES_TABLE', 'test-places')
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def valid_sqs_event():
-    """Valid SQS event with all required fields."""
-    return {
-        'Records': [
-            {
-                'messageId': 'test-message-id-123',
-                'body': json.dumps(
-                    {'city': 'SÃO PAULO', 'state': 'SP', 'niche': 'aasi'}
-                ),
-            }
-        ]
-    }
+    """Valid SQS event with all required fields; treat as read-only."""
+    return _sqs_event(_SQS_BODY_TEMPLATE)
 
 
 @pytest.fixture
@@ -115,52 +119,27 @@ class TestDataScrapperHandler:
         assert body['places_collected'] == 2
         assert body['quota_used'] == 100
 
-    def test_missing_records_in_event(self, mock_context, mock_env_vars):
-        """Test error handling when no Records in event."""
-        event = {}
-
+    @pytest.mark.parametrize(
+        'event, needle',
+        [
+            ({}, 'No SQS records'),
+            (_sqs_event(_without('city')), 'Missing required fields'),
+            (_sqs_event(_without('state')), 'Missing required fields'),
+            (
+                _sqs_event({**_SQS_BODY_TEMPLATE, 'niche': 'invalid_niche'}),
+                'Unknown niche',
+            ),
+        ],
+        ids=['no-records', 'no-city', 'no-state', 'bad-niche'],
+    )
+    def test_invalid_event(self, event, needle, mock_context, mock_env_vars):
+        """Test error handling for events the handler rejects."""
         result = gmaps_scrapper(event, mock_context)
 
         assert result['statusCode'] == 500
         body = json.loads(result['body'])
         assert body['success'] is False
-        assert 'No SQS records' in body['details']
-
-    def test_missing_city_field(self, mock_context, mock_env_vars):
-        """Test error handling when city is missing."""
-        event = {
-            'Records': [
-                {
-                    'messageId': 'test-id',
-                    'body': json.dumps({'state': 'SP', 'niche': 'aasi'}),
-                }
-            ]
-        }
-
-        result = gmaps_scrapper(event, mock_context)
-
-        assert result['statusCode'] == 500
-        body = json.loads(result['body'])
-        assert body['success'] is False
-        assert 'Missing required fields' in body['details']
-
-    def test_missing_state_field(self, mock_context, mock_env_vars):
-        """Test error handling when state is missing."""
-        event = {
-            'Records': [
-                {
-                    'messageId': 'test-id',
-                    'body': json.dumps({'city': 'SÃO PAULO', 'niche': 'aasi'}),
-                }
-            ]
-        }
-
-        result = gmaps_scrapper(event, mock_context)
-
-        assert result['statusCode'] == 500
-        body = json.loads(result['body'])
-        assert body['success'] is False
-        assert 'Missing required fields' in body['details']
+        assert needle in body['details']
 
     @patch('src.functions.data_scrapper.gmaps_handler.GMapsScrapper')
     def test_default_niche_when_not_provided(
@@ -168,14 +147,7 @@ class TestDataScrapperHandler:
     ):
         """Test that default niche 'aasi' is used when not provided."""
         mock_scrapper_class.return_value = mock_scrapper
-        event = {
-            'Records': [
-                {
-                    'messageId': 'test-id',
-                    'body': json.dumps({'city': 'SÃO PAULO', 'state': 'SP'}),
-                }
-            ]
-        }
+        event = _sqs_event(_without('niche'))
 
         result = gmaps_scrapper(event, mock_context)
 
@@ -183,26 +155,6 @@ class TestDataScrapperHandler:
         body = json.loads(result['body'])
         assert body['niche'] == 'aasi'
 
-    def test_invalid_niche(self, mock_context, mock_env_vars):
-        """Test error handling with invalid niche."""
-        event = {
-            'Records': [
-                {
-                    'messageId': 'test-id',
-                    'body': json.dumps(
-                        {'city': 'SÃO PAULO', 'state': 'SP', 'niche': 'invalid_niche'}
-                    ),
-                }
-            ]
-        }
-
-        result = gmaps_scrapper(event, mock_context)
-
-        assert result['statusCode'] == 500
-        body = json.loads(result['body'])
-        assert body['success'] is False
-        assert 'Unknown niche' in body['details']
-
     @patch('src.functions.data_scrapper.gmaps_handler.GMapsScrapper')
     def test_scraping_failed_status(
         self, mock_scrapper_class, valid_sqs_event, mock_context, mock_env_vars
@@ -235,7 +187,7 @@ class TestDataScrapperHandler:
             'Records': [
                 {
                     'messageId': 'test-id',
-                    'body': {'city': 'SÃO PAULO', 'state': 'SP', 'niche': 'aasi'},
+                    'body': dict(_SQS_BODY_TEMPLATE),
                 }
             ]
         }
@@ -250,23 +202,14 @@ class TestDataScrapperHandler:
 class TestLoadNiches:
     """Tests for the _load_niches helper function."""
 
-    @patch('builtins.open')
-    def test_load_niches_success(self, mock_open):
+    @patch('builtins.open', new_callable=mock_open, read_data='{}')
+    @patch(
+        'json.load',
+        return_value={'aasi': ['term1'], 'orl': ['term2'], 'geria': ['term3']},
+    )
+    def test_load_niches_success(self, mock_json_load, mock_file_open):
         """Test successful loading of niches from JSON file."""
-        mock_file = MagicMock()
-        mock_file.__enter__.return_value.read.return_value = json.dumps(
-            {'aasi': ['term1'], 'orl': ['term2'], 'geria': ['term3']}
-        )
-        mock_open.return_value = mock_file
-
-        # Mock json.load to return test data
-        with patch('json.load') as mock_json_load:
-            mock_json_load.return_value = {
-                'aasi': ['term1'],
-                'orl': ['term2'],
-                'geria': ['term3'],
-            }
-            niches = _load_niches()
+        niches = _load_niches()
 
         assert 'aasi' in niches
         assert 'orl' in niches
@@ -274,7 +217,7 @@ class TestLoadNiches:
         assert len(niches) == 3
 
     @patch('builtins.open', side_effect=FileNotFoundError())
-    def test_load_niches_file_not_found(self, mock_open):
+    def test_load_niches_file_not_found(self, mock_file_open):
         """Test fallback to default niche when file not found."""
         niches = _load_niches()
 
@@ -282,7 +225,7 @@ class TestLoadNiches:
 
     @patch('builtins.open')
     @patch('json.load', side_effect=json.JSONDecodeError('test', 'test', 0))
-    def test_load_niches_json_decode_error(self, mock_json_load, mock_open):
+    def test_load_niches_json_decode_error(self, mock_json_load, mock_file_open):
         """Test fallback to default niche on JSON decode error."""
         niches = _load_niches()
 
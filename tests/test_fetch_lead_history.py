@@ -9,7 +9,6 @@ This test file validates that the fetch_lead_history function correctly:
 - Handles various edge cases and error conditions
 """
 
-import importlib.util
 import json
 import os
 import sys
@@ -21,20 +20,9 @@ import pytest
 # Add src directory to the path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-# Import the handler module
-spec = importlib.util.spec_from_file_location(
-    'fetch_lead_history_handler',
-    os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__),
-            '../src/functions/gl_fetch_lead_history/fetch_lead_history_handler.py',
-        )
-    ),
+from src.functions.gl_fetch_lead_history.fetch_lead_history_handler import (
+    fetch_lead_history,
 )
-handler_module = importlib.util.module_from_spec(spec)
-sys.modules[spec.name] = handler_module
-spec.loader.exec_module(handler_module)
-fetch_lead_history = handler_module.fetch_lead_history
 
 
 # Fixtures
@@ -0,0 +1,115 @@
+"""Test cases for the gl_database_import handler.
+
+This test file validates the duplicate-phone filtering used by bulk imports:
+- GSI lookups per phone (COUNT-only queries)
+- Concurrent fan-out across unique phones
+- Error isolation between phone lookups
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+
+# Add src directory to the path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from src.functions.gl_database_import.gl_database_import_handler import (
+    _filter_duplicate_leads,
+    _phone_exists,
+)
+from src.shared.utils import LEADS_PHONE_INDEX, LEADS_PHONE_KEY_CONDITION
+
+
+# Fixtures
+@pytest.fixture
+def leads_db():
+    """Mock leads DatabaseHandler with a boto3 client."""
+    db = MagicMock()
+    db.client.query.return_value = {'Count': 0}
+    return db
+
+
+def _query_error(code='ProvisionedThroughputExceededException'):
+    """Build a ClientError as raised by the DynamoDB client."""
+    return ClientError({'Error': {'Code': code, 'Message': 'boom'}}, 'Query')
+
+
+class TestPhoneExists:
+    """Tests for the _phone_exists GSI lookup."""
+
+    def test_duplicate_found(self, leads_db):
+        """Test a positive count reports the phone as existing."""
+        leads_db.client.query.return_value = {'Count': 1}
+
+        assert _phone_exists(leads_db, 'company-1', '11999990000') is True
+
+        kwargs = leads_db.client.query.call_args.kwargs
+        assert kwargs['IndexName'] == LEADS_PHONE_INDEX
+        assert kwargs['KeyConditionExpression'] == LEADS_PHONE_KEY_CONDITION
+        assert kwargs['Select'] == 'COUNT'
+        assert kwargs['ExpressionAttributeValues'] == {
+            ':company_id': {'S': 'company-1'},
+            ':phone': {'S': '11999990000'},
+        }
+
+    def test_no_duplicate(self, leads_db):
+        """Test a zero count reports the phone as new."""
+        assert _phone_exists(leads_db, 'company-1', '11999990000') is False
+
+    def test_query_error_returns_false(self, leads_db):
+        """Test a failed query is treated as not duplicated."""
+        leads_db.client.query.side_effect = _query_error()
+
+        assert _phone_exists(leads_db, 'company-1', '11999990000') is False
+
+
+class TestFilterDuplicateLeads:
+    """Tests for the concurrent duplicate filtering of imported leads."""
+
+    @patch(
+        'src.functions.gl_database_import.gl_database_import_handler.DatabaseHandler'
+    )
+    def test_filters_duplicates_and_isolates_errors(self, mock_db_class, leads_db):
+        """Test duplicates are dropped and one failing lookup spares the rest."""
+        mock_db_class.return_value = leads_db
+        counts = {'11900000001': 1, '11900000002': 0, '11900000004': 0}
+
+        def query(**kwargs):
+            phone = kwargs['ExpressionAttributeValues'][':phone']['S']
+            if phone == '11900000003':
+                raise _query_error()
+            return {'Count': counts[phone]}
+
+        leads_db.client.query.side_effect = query
+        phones = ['11900000001', '11900000002', '11900000003', '11900000004']
+        validated_df = pd.DataFrame({'phone': phones})
+        complete_df = pd.DataFrame({'phone': phones})
+
+        filtered_df, duplicate_count = _filter_duplicate_leads(
+            complete_df, validated_df, 'company-1'
+        )
+
+        assert duplicate_count == 1
+        assert list(filtered_df['phone']) == phones[1:]
+        assert list(complete_df['is_duplicate']) == [True, False, False, False]
+        assert leads_db.client.query.call_count == len(phones)
+
+    @patch(
+        'src.functions.gl_database_import.gl_database_import_handler.DatabaseHandler'
+    )
+    def test_no_phones_skips_queries(self, mock_db_class):
+        """Test an import without phones never touches the table."""
+        validated_df = pd.DataFrame({'phone': [None]})
+        complete_df = pd.DataFrame({'phone': [None]})
+
+        filtered_df, duplicate_count = _filter_duplicate_leads(
+            complete_df, validated_df, 'company-1'
+        )
+
+        assert duplicate_count == 0
+        assert filtered_df is validated_df
+        mock_db_class.assert_not_called()
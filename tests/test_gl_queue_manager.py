@@ -19,9 +19,18 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from src.functions.gl_queue_manager.gl_queue_manager_handler import gl_queue_manager
+from src.shared import utils
 
 
 # Fixtures
+@pytest.fixture(autouse=True)
+def clear_boto_clients():
+    """Keep cached boto3 clients from leaking mocks between tests."""
+    utils._BOTO_CLIENTS.clear()
+    yield
+    utils._BOTO_CLIENTS.clear()
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Mock environment variables for settings."""
@@ -13,9 +13,12 @@ This test file validates the GMapsScrapper functionality including:
 import json
 import os
 import sys
+from decimal import Decimal
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import requests
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 
 # Add src directory to the path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
@@ -142,6 +145,7 @@ def mock_database_handler(mock_env_vars):
 
         # Mock get_item to return None (place doesn't exist)
         mock_db_instance.get_item.return_value = None
+        mock_db_instance._deserialize_item.side_effect = lambda item: item
 
         # Mock put_item to succeed
         mock_db_instance.put_item.return_value = {
@@ -242,16 +246,18 @@ class TestGMapsScrapperHelperMethods:
         """Test duplicate detection when location is within 50m threshold."""
         scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
 
-        existing_places = [
+        scrapper._add_place(
             {
                 'name': 'Existing Place',
                 'geometry': {'location': {'lat': -23.5505199, 'lng': -46.6333094}},
-            }
-        ]
+            },
+            -23.5505199,
+            -46.6333094,
+        )
 
         # Check location 30 meters away (within threshold)
         duplicate = scrapper._is_duplicate_location(
-            -23.5505199 + 0.0003, -46.6333094, existing_places  # ~33m north
+            -23.5505199 + 0.0003, -46.6333094  # ~33m north
         )
 
         assert duplicate is not None
@@ -263,20 +269,58 @@ class TestGMapsScrapperHelperMethods:
         """Test that locations outside 50m threshold are not duplicates."""
         scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
 
-        existing_places = [
+        scrapper._add_place(
             {
                 'name': 'Existing Place',
                 'geometry': {'location': {'lat': -23.5505199, 'lng': -46.6333094}},
-            }
-        ]
+            },
+            -23.5505199,
+            -46.6333094,
+        )
 
         # Check location 100 meters away (outside threshold)
         duplicate = scrapper._is_duplicate_location(
-            -23.5505199 + 0.001, -46.6333094, existing_places  # ~111m north
+            -23.5505199 + 0.001, -46.6333094  # ~111m north
         )
 
         assert duplicate is None
 
+    def test_is_duplicate_location_across_grid_cells(
+        self, valid_api_key, mock_database_handler
+    ):
+        """Test duplicate detection for places on opposite sides of a grid cell."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        existing_place = {
+            'name': 'Existing Place',
+            'geometry': {'location': {'lat': -23.5, 'lng': -46.6}},
+        }
+        scrapper._add_place(existing_place, -23.5, -46.6)
+
+        # ~22m south and ~10m west, which falls in the neighbouring cells
+        duplicate = scrapper._is_duplicate_location(-23.5002, -46.6001)
+
+        assert duplicate is existing_place
+
+    def test_convert_place_to_legacy_format(
+        self, valid_api_key, mock_database_handler, mock_place_details_response
+    ):
+        """Test conversion of a new API place into the legacy format."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+
+        legacy = scrapper._convert_place_to_legacy_format(mock_place_details_response)
+
+        assert legacy['id'] == 'ChIJN1t_tDeuEmsRUsoyG83frY4'
+        assert legacy['name'] == 'Centro Auditivo São Paulo'
+        assert legacy['geometry'] == {
+            'location': {'lat': -23.5505199, 'lng': -46.6333094}
+        }
+        assert legacy['formatted_phone_number'] == '(11) 3456-7890'
+        assert legacy['website'] == 'https://centroauditivo.com.br'
+        assert legacy['price_level'] == 'PRICE_LEVEL_MODERATE'
+        assert legacy['opening_hours']['open_now'] is True
+        assert len(legacy['opening_hours']['weekday_text']) == 2
+        assert 'displayName' not in legacy
+
     def test_check_quota_within_limit(self, valid_api_key, mock_database_handler):
         """Test quota check when within limit."""
         scrapper = GMapsScrapper(
@@ -425,6 +469,102 @@ class TestGMapsScrapperCollectPlaces:
         assert scrapper.ensamble['status'] == 'partial_quota_exceeded'
         assert 'quota' in scrapper.ensamble['status_reason'].lower()
 
+    @patch('src.models.scrappers.gmaps_scrapper.requests.get')
+    @patch('src.models.scrappers.gmaps_scrapper.requests.post')
+    def test_collect_data_skips_details_by_default(
+        self,
+        mock_post,
+        mock_get,
+        valid_api_key,
+        mock_database_handler,
+        mock_text_search_response,
+    ):
+        """Test that Place Details are not fetched unless enabled."""
+        mock_response = Mock()
+        mock_response.json.return_value = mock_text_search_response
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        scrapper.collect_data(city='SÃO PAULO', state='SP')
+
+        assert scrapper.fetch_details is False
+        mock_get.assert_not_called()
+        assert scrapper.ensamble['stats']['details_fetched'] == 0
+        assert len(scrapper.ensamble['places']) > 0
+
+    @patch('src.models.scrappers.gmaps_scrapper.requests.get')
+    def test_enrich_with_details_updates_places(
+        self,
+        mock_get,
+        valid_api_key,
+        mock_database_handler,
+        mock_place_details_response,
+    ):
+        """Test that concurrent detail fetches are merged into each place."""
+        mock_details = Mock()
+        mock_details.json.return_value = mock_place_details_response
+        mock_details.raise_for_status.return_value = None
+        mock_get.return_value = mock_details
+
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        places = [
+            {'id': f'place-{i}', 'name': f'Place {i}', 'extra': i} for i in range(3)
+        ]
+        scrapper._enrich_with_details(places)
+
+        assert mock_get.call_count == 3
+        assert all(p['website'] == 'https://centroauditivo.com.br' for p in places)
+        assert [p['extra'] for p in places] == [0, 1, 2]
+        assert scrapper.quota_used == 3 * 17
+        assert scrapper.ensamble['stats']['details_fetched'] == 3
+
+    @patch('src.models.scrappers.gmaps_scrapper.requests.get')
+    def test_enrich_with_details_skips_known_places(
+        self, mock_get, valid_api_key, mock_database_handler
+    ):
+        """Test that places already stored reuse their reviews instead."""
+        stored_reviews = [{'rating': 5}]
+        mock_database_handler.get_item.return_value = {
+            'placeID': 'place-1',
+            'reviews': stored_reviews,
+        }
+
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        places = [{'id': 'place-1', 'name': 'Place 1'}]
+        scrapper._enrich_with_details(places)
+
+        mock_get.assert_not_called()
+        assert places[0]['reviews'] == stored_reviews
+        assert scrapper.quota_used == 0
+        assert scrapper.ensamble['stats']['details_skipped_known'] == 1
+
+    @patch('src.models.scrappers.gmaps_scrapper.requests.get')
+    def test_failed_details_release_reserved_quota(
+        self, mock_get, valid_api_key, mock_database_handler
+    ):
+        """Test that quota reserved for a failed details request is released."""
+        mock_get.side_effect = requests.exceptions.ConnectionError('boom')
+
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+
+        assert scrapper._get_place_details('place-1') is None
+        assert scrapper.quota_used == 0
+        assert scrapper.ensamble['quota_used'] == 0
+
+    @patch('src.models.scrappers.gmaps_scrapper.requests.post')
+    def test_collect_data_stops_after_api_failure(
+        self, mock_post, valid_api_key, mock_database_handler
+    ):
+        """Test that remaining search terms are skipped after an API failure."""
+        mock_post.side_effect = requests.exceptions.ConnectionError('down')
+
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        scrapper.collect_data(city='SÃO PAULO', state='SP')
+
+        assert mock_post.call_count == 1
+        assert scrapper.ensamble['status'] == 'failed_api_error'
+
     def test_collect_data_with_no_search_terms(
         self, valid_api_key, mock_database_handler
     ):
@@ -452,6 +592,96 @@ class TestGMapsScrapperCollectPlaces:
         ]
 
 
+# Tests for _save_to_database Method
+class TestGMapsScrapperSaveToDatabase:
+    """Tests for the _save_to_database method."""
+
+    @pytest.fixture
+    def place(self):
+        """Place already converted to the legacy format."""
+        return {
+            'id': 'ChIJN1t_tDeuEmsRUsoyG83frY4',
+            'name': 'Centro Auditivo São Paulo',
+            'geometry': {'location': {'lat': -23.5505199, 'lng': -46.6333094}},
+            'types': ['store', 'health'],
+        }
+
+    def test_compute_data_hash_ignores_key_order(
+        self, valid_api_key, mock_database_handler, place
+    ):
+        """Test that the data hash is stable across key ordering."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        reordered = dict(reversed(list(place.items())))
+
+        assert scrapper._compute_data_hash(place) == scrapper._compute_data_hash(
+            reordered
+        )
+
+    def test_save_skips_unchanged_place(
+        self, valid_api_key, mock_database_handler, place
+    ):
+        """Test that a place with matching dataHash is not updated."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        mock_database_handler.get_item.return_value = {
+            'placeID': place['id'],
+            'dataHash': scrapper._compute_data_hash(place),
+        }
+        scrapper.ensamble['places'] = [place]
+
+        assert scrapper._save_to_database('SÃO PAULO', 'SP') is True
+
+        mock_database_handler.update_item.assert_not_called()
+        assert scrapper.ensamble['stats']['skipped_places'] == 1
+
+    def test_save_skips_place_round_tripped_through_dynamodb(
+        self, valid_api_key, mock_database_handler, place
+    ):
+        """Test reused reviews read back as Decimals do not change the hash."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        place['reviews'] = [{'rating': 5, 'time': 1634560490, 'text': 'Ótimo'}]
+        stored = {**place, 'placeID': place['id']}
+        stored['dataHash'] = scrapper._compute_data_hash(place)
+
+        # DynamoDB keeps every number as a Decimal
+        serializer = TypeSerializer()
+        stored = json.loads(json.dumps(stored), parse_float=Decimal)
+        mock_database_handler.get_item.return_value = {
+            key: serializer.serialize(value) for key, value in stored.items()
+        }
+        deserializer = TypeDeserializer()
+        mock_database_handler._deserialize_item.side_effect = lambda item: {
+            key: deserializer.deserialize(value) for key, value in item.items()
+        }
+
+        # The next run finds the place without reviews and reuses the stored ones
+        fresh = {key: value for key, value in place.items() if key != 'reviews'}
+        scrapper._enrich_with_details([fresh])
+        scrapper.ensamble['places'] = [fresh]
+
+        scrapper._save_to_database('SÃO PAULO', 'SP')
+
+        assert isinstance(fresh['reviews'][0]['rating'], Decimal)
+        mock_database_handler.update_item.assert_not_called()
+        assert scrapper.ensamble['stats']['skipped_places'] == 1
+
+    def test_save_updates_changed_place(
+        self, valid_api_key, mock_database_handler, place
+    ):
+        """Test that a place with a stale dataHash is updated."""
+        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        mock_database_handler.get_item.return_value = {
+            'placeID': place['id'],
+            'dataHash': 'stale-hash',
+        }
+        scrapper.ensamble['places'] = [place]
+
+        scrapper._save_to_database('SÃO PAULO', 'SP')
+
+        updates = mock_database_handler.update_item.call_args.kwargs['updates']
+        assert updates['dataHash'] == scrapper._compute_data_hash(place)
+        assert scrapper.ensamble['stats']['updated_places'] == 1
+
+
 # Integration-style Tests
 class TestGMapsScrapperIntegration:
     """Integration tests for GMapsScrapper with real-like scenarios."""
@@ -479,7 +709,9 @@ class TestGMapsScrapperIntegration:
         mock_details.raise_for_status.return_value = None
         mock_get.return_value = mock_details
 
-        scrapper = GMapsScrapper(niche='aasi', api_key=valid_api_key)
+        scrapper = GMapsScrapper(
+            niche='aasi', api_key=valid_api_key, fetch_details=True
+        )
         scrapper.collect_data(city='SÃO PAULO', state='SP')
 
         # Verify complete workflow
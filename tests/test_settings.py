@@ -10,6 +10,7 @@ This test file validates the centralized settings functionality including:
 """
 
 import os
+import subprocess
 import sys
 from unittest.mock import patch
 
@@ -42,6 +43,7 @@ class TestSettings:
         settings = Settings()
 
         assert settings.stage == 'prod'
+        assert settings.stage_suffix == 'PROD'
         assert settings.region == 'us-east-1'
         assert settings.is_development() is False
         assert settings.is_production() is True
@@ -188,6 +190,24 @@ class TestSettings:
 
         assert settings.google_places_daily_quota_limit == 20000
 
+    @patch.dict(os.environ, {'STAGE': 'dev'}, clear=True)
+    def test_fetch_details_default_disabled(self):
+        """Test that Place Details fetching is disabled by default."""
+        from src.shared.settings import Settings
+
+        settings = Settings()
+
+        assert settings.google_places_fetch_details is False
+
+    @patch.dict(os.environ, {'STAGE': 'dev', 'GOOGLE_PLACES_FETCH_DETAILS': 'true'})
+    def test_fetch_details_enabled_from_env(self):
+        """Test enabling Place Details fetching from environment variable."""
+        from src.shared.settings import Settings
+
+        settings = Settings()
+
+        assert settings.google_places_fetch_details is True
+
     @patch.dict(os.environ, {'STAGE': 'dev'})
     def test_scraper_task_queue_name(self):
         """Test scraper task queue name generation."""
@@ -238,3 +258,93 @@ class TestSettings:
         assert "region='us-west-2'" in repr_str
         assert "companies_table='dev-auris-core-companies'" in repr_str
         assert "places_table='dev-auris-core-places'" in repr_str
+
+    @patch.dict(os.environ, {'STAGE': 'dev', 'LEADS_TABLE': 'first-leads'})
+    def test_values_cached_after_first_access(self):
+        """Test environment values are read once per instance."""
+        from src.shared.settings import Settings
+
+        settings = Settings()
+
+        assert settings.leads_table_name == 'first-leads'
+        os.environ['LEADS_TABLE'] = 'second-leads'
+        assert settings.leads_table_name == 'first-leads'
+        assert Settings().leads_table_name == 'second-leads'
+
+
+class TestEnvFileLoading:
+    """Tests for .env loading at import time."""
+
+    @patch.dict(os.environ, {'AWS_LAMBDA_FUNCTION_NAME': 'gl-add-new-lead'})
+    def test_env_file_skipped_in_lambda(self):
+        """Test the .env file is not parsed inside AWS Lambda."""
+        from src.shared import settings as settings_module
+
+        with patch.object(settings_module, 'load_dotenv') as mock_load:
+            settings_module._load_env_file()
+
+        mock_load.assert_not_called()
+
+    @patch.dict(os.environ, {'SKIP_DOTENV': '1'})
+    def test_env_file_skipped_with_flag(self):
+        """Test SKIP_DOTENV disables .env parsing."""
+        from src.shared import settings as settings_module
+
+        with patch.object(settings_module, 'load_dotenv') as mock_load:
+            settings_module._load_env_file()
+
+        mock_load.assert_not_called()
+
+    def test_env_file_loaded_locally(self):
+        """Test the .env file is parsed outside Lambda."""
+        from src.shared import settings as settings_module
+
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key not in ('AWS_LAMBDA_FUNCTION_NAME', 'SKIP_DOTENV')
+        }
+        with patch.dict(os.environ, env, clear=True), patch.object(
+            settings_module, 'load_dotenv'
+        ) as mock_load:
+            settings_module._load_env_file()
+
+        mock_load.assert_called_once()
+
+
+class TestGlobalSettings:
+    """Tests for the lazily created global settings instance."""
+
+    @patch.dict(os.environ, {'STAGE': 'dev'})
+    def test_global_settings_created_once(self):
+        """Test the module-level settings is a single shared instance."""
+        from src.shared import settings as settings_module
+        from src.shared.settings import Settings, settings
+
+        assert isinstance(settings, Settings)
+        assert settings_module.settings is settings
+
+    def test_unknown_attribute_raises(self):
+        """Test other missing module attributes still raise AttributeError."""
+        from src.shared import settings as settings_module
+
+        with pytest.raises(AttributeError):
+            _ = settings_module.not_a_setting
+
+    def test_shared_utils_import_does_not_build_settings(self):
+        """Test importing a Settings-class handler leaves the global unbuilt."""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import sys, '
+                'src.functions.gl_database_import.gl_database_import_handler; '
+                "sys.exit(sys.modules['src.shared.settings']._settings is not None)",
+            ],
+            cwd=root,
+            env={**os.environ, 'STAGE': 'dev'},
+            capture_output=True,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,345 @@
+"""
+Test cases for the shared utility functions.
+
+This test file validates the helpers in src/shared/utils.py including:
+- boto3 client caching
+- CNPJ cleaning and validation
+- Lambda response building
+- Levenshtein distance and similarity ratio
+- Company existence validation
+- Duplicate phone checks
+"""
+
+import os
+import random
+import subprocess
+import sys
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add src directory to the path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from src.shared import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_boto_clients():
+    """Isolate tests from the module-level client cache."""
+    utils._BOTO_CLIENTS.clear()
+    yield
+    utils._BOTO_CLIENTS.clear()
+
+
+class TestGetBotoClient:
+    """Tests for the cached boto3 client factory."""
+
+    @patch('boto3.client')
+    def test_client_reused_per_service_and_region(self, mock_client):
+        """Test a client is created once per service and region."""
+        mock_client.side_effect = lambda service, region_name, config: Mock(
+            service=service, region=region_name
+        )
+
+        first = utils.get_boto_client('sqs', 'us-east-1')
+        second = utils.get_boto_client('sqs', 'us-east-1')
+        other_region = utils.get_boto_client('sqs', 'sa-east-1')
+        other_service = utils.get_boto_client('s3', 'us-east-1')
+
+        assert first is second
+        assert other_region is not first
+        assert other_service is not first
+        assert mock_client.call_count == 3
+
+    @patch('boto3.client')
+    def test_client_uses_pooled_keepalive_config(self, mock_client):
+        """Test clients are built with the shared connection config."""
+        utils.get_boto_client('dynamodb', 'us-east-1')
+
+        config = mock_client.call_args.kwargs['config']
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 50
+
+    def test_import_does_not_load_boto3(self):
+        """Test importing the module alone does not import boto3."""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import sys, src.shared.utils; ' "sys.exit('boto3' in sys.modules)",
+            ],
+            cwd=root,
+            capture_output=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestCnpj:
+    """Tests for CNPJ cleaning and validation."""
+
+    def test_clean_cnpj_strips_formatting(self):
+        """Test formatted CNPJs are reduced to digits."""
+        assert utils.clean_cnpj('11.222.333/0001-81') == '11222333000181'
+
+    def test_clean_cnpj_wrong_length(self):
+        """Test CNPJs without 14 digits are rejected."""
+        assert utils.clean_cnpj('11.222.333/0001') is None
+        assert utils.clean_cnpj('') is None
+
+    def test_validate_cnpj(self):
+        """Test check digits are verified."""
+        assert utils.validate_cnpj('11.222.333/0001-81') is True
+        assert utils.validate_cnpj('11222333000181') is True
+        assert utils.validate_cnpj('11.222.333/0001-82') is False
+        assert utils.validate_cnpj('11.111.111/1111-11') is False
+        assert utils.validate_cnpj(None) is False
+
+    def test_digits_only(self):
+        """Test formatting and non-ASCII digits are stripped."""
+        assert utils._digits_only('11987654321') == '11987654321'
+        assert utils._digits_only('+55 (11) 98765-4321') == '5511987654321'
+        assert utils._digits_only('12²3') == '123'
+
+    def test_validate_cnpj_rejects_non_ascii_digits(self):
+        """Test non-ASCII digits are stripped rather than accepted."""
+        assert utils.validate_cnpj('١١٢٢٢٣٣٣٠٠٠١٨١') is False
+
+
+class TestResponse:
+    """Tests for the Lambda response builder."""
+
+    def test_default_headers(self):
+        """Test the JSON content type is set and the body serialized."""
+        result = utils.response({'ok': True}, HTTPStatus.CREATED)
+
+        assert type(result['statusCode']) is int
+        assert result == {
+            'statusCode': 201,
+            'headers': {'Content-Type': 'application/json'},
+            'body': '{"ok": true}',
+        }
+
+    def test_extra_headers_merged(self):
+        """Test extra headers are merged over the defaults."""
+        result = utils.response('ok', headers={'X-Request-Id': 'abc'})
+
+        assert result['headers'] == {
+            'Content-Type': 'application/json',
+            'X-Request-Id': 'abc',
+        }
+
+    def test_headers_not_shared_between_calls(self):
+        """Test mutating one response does not leak into the next."""
+        first = utils.response('ok')
+        first['headers']['Access-Control-Allow-Origin'] = '*'
+
+        assert utils.response('ok')['headers'] == {'Content-Type': 'application/json'}
+
+
+class TestLevenshtein:
+    """Tests for edit distance and similarity ratio."""
+
+    @pytest.mark.parametrize(
+        's1, s2, expected',
+        [
+            ('', '', 0),
+            ('', 'abc', 3),
+            ('kitten', 'sitting', 3),
+            ('flaw', 'lawn', 2),
+            ('audicare', 'audicare', 0),
+            ('são paulo', 'sao paulo', 1),
+            ('clinica audicare', 'clinica audicare centro', 7),
+            ('aaaa', 'aa', 2),
+            ('abcab', 'ab', 3),
+        ],
+    )
+    def test_levenshtein_distance(self, s1, s2, expected):
+        """Test known edit distances, including accented characters."""
+        assert utils.calculate_levenshtein_distance(s1, s2) == expected
+        assert utils.calculate_levenshtein_distance(s2, s1) == expected
+
+    def test_levenshtein_matches_reference_dp(self):
+        """Test the bit-parallel distance against a plain DP on random input."""
+
+        def reference(s1, s2):
+            previous = list(range(len(s2) + 1))
+            for i, c1 in enumerate(s1, 1):
+                current = [i]
+                for j, c2 in enumerate(s2, 1):
+                    current.append(
+                        min(
+                            previous[j] + 1,
+                            current[j - 1] + 1,
+                            previous[j - 1] + (c1 != c2),
+                        )
+                    )
+                previous = current
+            return previous[-1]
+
+        rng = random.Random(42)
+        for _ in range(500):
+            s1 = ''.join(rng.choice('abcã ') for _ in range(rng.randint(0, 90)))
+            s2 = ''.join(rng.choice('abcã ') for _ in range(rng.randint(0, 90)))
+            assert utils.calculate_levenshtein_distance(s1, s2) == reference(s1, s2)
+
+    def test_normalize_string(self):
+        """Test casing and whitespace runs are normalized."""
+        assert (
+            utils.normalize_string('  Clínica\t Auditiva\n  SP ')
+            == 'clínica auditiva sp'
+        )
+        assert utils.normalize_string('') == ''
+
+    def test_similarity_ratio(self):
+        """Test the ratio is normalized and relative to the longest string."""
+        assert utils.calculate_similarity_ratio('Audicare ', 'audicare') == 100.0
+        assert utils.calculate_similarity_ratio('kitten', 'sitting') == 57.14
+        assert utils.calculate_similarity_ratio('', 'abc') == 0.0
+
+    def test_similarity_ratio_length_bound_skips_distance(self):
+        """Test pairs too different in length skip the distance computation."""
+        with patch.object(utils, 'calculate_levenshtein_distance') as mock_distance:
+            ratio = utils.calculate_similarity_ratio(
+                'Audicare', 'Audicare Aparelhos Auditivos', min_ratio=90
+            )
+
+        mock_distance.assert_not_called()
+        assert ratio is None
+
+    def test_similarity_ratios_marks_ruled_out_candidates(self):
+        """Test the batch API applies min_ratio to every candidate."""
+        ratios = utils.calculate_similarity_ratios(
+            'Audicare', ['Audicare Aparelhos Auditivos', 'AUDICARE'], min_ratio=90
+        )
+
+        assert ratios == [None, 100.0]
+
+    def test_similarity_ratio_min_ratio_within_bound(self):
+        """Test the exact ratio is still returned when the bound allows it."""
+        assert utils.calculate_similarity_ratio(
+            'kitten', 'sitting', min_ratio=50
+        ) == utils.calculate_similarity_ratio('kitten', 'sitting')
+
+    def test_similarity_ratios_matches_scalar(self):
+        """Test the batch API matches per-pair ratios."""
+        candidates = ['Audicare', 'Audicare Centro', '', 'Ouvir Bem']
+
+        ratios = utils.calculate_similarity_ratios(' AUDICARE ', candidates)
+
+        assert ratios == [
+            utils.calculate_similarity_ratio('Audicare', candidate)
+            for candidate in candidates
+        ]
+
+    def test_similarity_ratio_cached_per_normalized_pair(self):
+        """Test equivalent and swapped pairs reuse the cached ratio."""
+        utils._similarity_ratio.cache_clear()
+
+        first = utils.calculate_similarity_ratio('Audicare Centro', 'Audicare')
+        second = utils.calculate_similarity_ratio('audicare', ' AUDICARE  centro ')
+
+        assert first == second
+        info = utils._similarity_ratio.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestValidateCompanyExists:
+    """Tests for the cached company existence check."""
+
+    @pytest.fixture(autouse=True)
+    def clear_company_cache(self):
+        """Isolate tests from the module-level company cache."""
+        utils._COMPANY_EXISTS_CACHE.clear()
+        yield
+        utils._COMPANY_EXISTS_CACHE.clear()
+
+    def test_existing_company_cached(self):
+        """Test a found company is not fetched again within the TTL."""
+        db_handler = Mock()
+        db_handler.get_item.return_value = {'companyID': 'company-123'}
+
+        utils.validate_company_exists('company-123', db_handler)
+        utils.validate_company_exists('company-123', db_handler)
+
+        db_handler.get_item.assert_called_once_with(key={'companyID': 'company-123'})
+
+    def test_cache_expires(self):
+        """Test the company is fetched again once the TTL has passed."""
+        db_handler = Mock()
+        db_handler.get_item.return_value = {'companyID': 'company-123'}
+
+        with patch.object(utils.time, 'monotonic', side_effect=[0.0, 61.0, 61.0]):
+            utils.validate_company_exists('company-123', db_handler)
+            utils.validate_company_exists('company-123', db_handler)
+
+        assert db_handler.get_item.call_count == 2
+
+    def test_missing_company_not_cached(self):
+        """Test a missing company raises every time."""
+        db_handler = Mock()
+        db_handler.get_item.return_value = None
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match='does not exist'):
+                utils.validate_company_exists('missing', db_handler)
+
+        assert db_handler.get_item.call_count == 2
+
+
+class TestCheckDuplicatePhone:
+    """Tests for the GSI-backed duplicate phone check."""
+
+    @staticmethod
+    def _client_error(code, message):
+        return ClientError({'Error': {'Code': code, 'Message': message}}, 'Query')
+
+    def test_duplicate_found(self):
+        """Test an existing lead is reported as a conflict."""
+        db_handler = Mock()
+        db_handler.client.query.return_value = {'Items': [{'leadId': {'S': 'x'}}]}
+
+        result = utils.check_duplicate_phone('company-123', '11987654321', db_handler)
+
+        assert result['status'] == HTTPStatus.CONFLICT
+
+    def test_no_duplicate(self):
+        """Test a free phone number is accepted."""
+        db_handler = Mock()
+        db_handler.client.query.return_value = {'Items': []}
+
+        result = utils.check_duplicate_phone('company-123', '11987654321', db_handler)
+
+        assert result['status'] == HTTPStatus.OK
+
+    def test_missing_gsi(self):
+        """Test a missing index is reported with setup instructions."""
+        db_handler = Mock()
+        db_handler.client.query.side_effect = self._client_error(
+            'ValidationException', 'The table does not have the specified index'
+        )
+
+        with pytest.raises(ValueError, match='is not available'):
+            utils.check_duplicate_phone('company-123', '11987654321', db_handler)
+
+    @pytest.mark.parametrize(
+        'code, message',
+        [
+            (
+                'ValidationException',
+                'An AttributeValue may not contain an empty string',
+            ),
+            ('ResourceNotFoundException', 'Requested resource not found'),
+        ],
+    )
+    def test_other_client_error(self, code, message):
+        """Test unrelated DynamoDB errors are not mistaken for a missing GSI."""
+        db_handler = Mock()
+        db_handler.client.query.side_effect = self._client_error(code, message)
+
+        with pytest.raises(ValueError, match='Error checking for duplicate phone'):
+            utils.check_duplicate_phone('company-123', '', db_handler)
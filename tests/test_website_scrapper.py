@@ -8,22 +8,42 @@ This test file validates website scraping functionality including:
 - Database integration and status tracking
 """
 
+import io
 import json
 import os
 import sys
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, Mock, mock_open, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
+import lxml.html
 import pytest
 from bs4 import BeautifulSoup
 
 # Add src directory to the path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
+from src.models.scrappers import website_scrapper
 from src.models.scrappers.website_scrapper import WebsiteScrapper
 
 
 # Fixtures
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    """Isolate tests from the module-level caches."""
+    website_scrapper._ROBOTS_CACHE.clear()
+    website_scrapper._RATE_LIMITERS.clear()
+    yield
+    website_scrapper._ROBOTS_CACHE.clear()
+    website_scrapper._RATE_LIMITERS.clear()
+
+
+def _page_response(text, status_code=200):
+    """Build a mocked streamed page response."""
+    response = Mock(status_code=status_code, encoding='utf-8', text=text)
+    response.iter_content.return_value = [text.encode('utf-8')]
+    return response
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings for testing."""
@@ -190,6 +210,10 @@ class TestWebsiteScrapperInit:
         assert scrapper.timeout == 10
         assert scrapper.ensamble['status'] == 'in_progress'
 
+        adapter = scrapper._session.get_adapter('https://audicare.com.br')
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+
     def test_init_normalizes_url_without_scheme(
         self, mock_boto3_setup, mock_settings, mock_db_handler, mock_gemini_handler
     ):
@@ -269,19 +293,24 @@ class TestURLNormalization:
 class TestRobotsTxtCheck:
     """Tests for robots.txt checking."""
 
-    @patch('src.models.scrappers.website_scrapper.RobotFileParser')
+    @staticmethod
+    def _robots_response(status_code=200, text=''):
+        response = Mock()
+        response.status_code = status_code
+        response.text = text
+        return response
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_check_robots_txt_allowed(
         self,
-        mock_robot_parser_class,
+        mock_get,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
         mock_gemini_handler,
     ):
         """Test robots.txt allows scraping."""
-        mock_rp = Mock()
-        mock_rp.can_fetch.return_value = True
-        mock_robot_parser_class.return_value = mock_rp
+        mock_get.return_value = self._robots_response(text='User-agent: *\nAllow: /')
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
@@ -291,20 +320,20 @@ class TestRobotsTxtCheck:
 
         result = scrapper._check_robots_txt('https://example.com')
         assert result is True
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0] == 'https://example.com/robots.txt'
 
-    @patch('src.models.scrappers.website_scrapper.RobotFileParser')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_check_robots_txt_disallowed(
         self,
-        mock_robot_parser_class,
+        mock_get,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
         mock_gemini_handler,
     ):
         """Test robots.txt disallows scraping."""
-        mock_rp = Mock()
-        mock_rp.can_fetch.return_value = False
-        mock_robot_parser_class.return_value = mock_rp
+        mock_get.return_value = self._robots_response(text='User-agent: *\nDisallow: /')
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
@@ -315,19 +344,17 @@ class TestRobotsTxtCheck:
         result = scrapper._check_robots_txt('https://example.com')
         assert result is False
 
-    @patch('src.models.scrappers.website_scrapper.RobotFileParser')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_check_robots_txt_not_found_allows(
         self,
-        mock_robot_parser_class,
+        mock_get,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
         mock_gemini_handler,
     ):
         """Test missing robots.txt allows scraping by default."""
-        mock_rp = Mock()
-        mock_rp.read.side_effect = Exception('404 Not Found')
-        mock_robot_parser_class.return_value = mock_rp
+        mock_get.return_value = self._robots_response(status_code=404)
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
@@ -338,13 +365,125 @@ class TestRobotsTxtCheck:
         result = scrapper._check_robots_txt('https://example.com')
         assert result is True
 
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_check_robots_txt_unreachable_allows(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test robots.txt that cannot be fetched allows scraping."""
+        import requests
+
+        mock_get.side_effect = requests.exceptions.ConnectionError('refused')
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://example.com',
+            gemini_api_key='test-key',
+        )
+
+        result = scrapper._check_robots_txt('https://example.com')
+        assert result is True
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_check_robots_txt_cached_per_host(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test robots.txt is read once per host across instances."""
+        mock_get.return_value = self._robots_response(text='User-agent: *\nAllow: /')
+
+        for _ in range(2):
+            scrapper = WebsiteScrapper(
+                company_id='test-uuid',
+                website='https://example.com',
+                gemini_api_key='test-key',
+            )
+            assert scrapper._check_robots_txt('https://example.com') is True
+
+        mock_get.assert_called_once()
+
+    @patch('src.models.scrappers.website_scrapper.time.monotonic')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_check_robots_txt_cache_expires(
+        self,
+        mock_get,
+        mock_monotonic,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test cached robots.txt is refetched after its TTL."""
+        import requests
+
+        mock_get.return_value = self._robots_response(text='User-agent: *\nAllow: /')
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://example.com',
+            gemini_api_key='test-key',
+        )
+
+        mock_monotonic.return_value = 1000.0
+        scrapper._check_robots_txt('https://example.com')
+        mock_monotonic.return_value = 1000.0 + 5 * 3600
+        scrapper._check_robots_txt('https://example.com')
+        assert mock_get.call_count == 1
+
+        mock_monotonic.return_value = 1000.0 + 7 * 3600
+        scrapper._check_robots_txt('https://example.com')
+        assert mock_get.call_count == 2
+
+        # Unreadable robots.txt is only cached for a few minutes
+        website_scrapper._ROBOTS_CACHE.clear()
+        mock_get.side_effect = requests.exceptions.ConnectionError('refused')
+        mock_monotonic.return_value = 50000.0
+        scrapper._check_robots_txt('https://example.com')
+        mock_monotonic.return_value = 50000.0 + 301
+        scrapper._check_robots_txt('https://example.com')
+        assert mock_get.call_count == 4
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_fetch_page_content_respects_robots(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test disallowed pages are skipped without an HTTP request."""
+        mock_get.return_value = self._robots_response(
+            text='User-agent: *\nDisallow: /privado'
+        )
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://example.com',
+            gemini_api_key='test-key',
+        )
+        scrapper._check_robots_txt('https://example.com')
+        mock_get.reset_mock()
+
+        html = scrapper._fetch_page_content('https://example.com/privado')
+
+        assert html is None
+        mock_get.assert_not_called()
+
 
 # Test page discovery strategies
 @patch('src.models.scrappers.website_scrapper.boto3.setup_default_session')
 class TestPageDiscovery:
     """Tests for page discovery strategies."""
 
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_discover_pages_from_sitemap(
         self,
         mock_get,
@@ -357,7 +496,7 @@ class TestPageDiscovery:
         """Test page discovery from sitemap.xml."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = sample_sitemap_xml.encode('utf-8')
+        mock_response.raw = io.BytesIO(sample_sitemap_xml.encode('utf-8'))
         mock_get.return_value = mock_response
 
         scrapper = WebsiteScrapper(
@@ -376,7 +515,154 @@ class TestPageDiscovery:
             or 'https://audicare.com.br/sobre' in pages
         )
 
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_discover_pages_from_sitemap_probes_all_paths(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+        sample_sitemap_xml,
+    ):
+        """Test every sitemap path is probed and a later hit is used."""
+        responses = []
+
+        def get_side_effect(url, **kwargs):
+            response = Mock()
+            responses.append(response)
+            if url.endswith('/sitemap_index.xml'):
+                response.status_code = 200
+                response.raw = io.BytesIO(sample_sitemap_xml.encode('utf-8'))
+            else:
+                response.status_code = 404
+            return response
+
+        mock_get.side_effect = get_side_effect
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        pages = scrapper._discover_pages_from_sitemap('https://audicare.com.br')
+
+        assert mock_get.call_count == 4
+        assert all(call.kwargs['stream'] for call in mock_get.call_args_list)
+        assert 'https://audicare.com.br/sobre' in pages
+        # Every streamed response is released, including the unused ones
+        assert all(response.close.called for response in responses)
+
+    def test_discover_pages_dedupes_in_priority_order(
+        self,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test candidates are deduplicated canonically and keep their order."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        scrapper._discover_pages_from_homepage = Mock(
+            return_value=['https://audicare.com.br/sobre', 'https://audicare.com.br']
+        )
+        scrapper._discover_pages_from_sitemap = Mock(
+            return_value=['https://audicare.com.br/', 'https://AUDICARE.com.br/sobre/']
+        )
+        scrapper._discover_pages_common_paths = Mock(
+            return_value=['https://audicare.com.br/contato']
+        )
+        scrapper._probe_page_size = Mock(return_value=1000)
+
+        pages = scrapper._discover_pages('https://audicare.com.br')
+
+        # Equal sizes and scores keep discovery order; the root page ranks last
+        assert pages == [
+            'https://audicare.com.br/sobre',
+            'https://audicare.com.br/contato',
+            'https://audicare.com.br',
+        ]
+
+    def test_discover_pages_bounds_probes_for_large_sitemap(
+        self,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test a huge sitemap only probes the most relevant candidates."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        sitemap = [f'https://audicare.com.br/blog/post-{i}' for i in range(500)]
+        scrapper._discover_pages_from_homepage = Mock(return_value=[])
+        scrapper._discover_pages_from_sitemap = Mock(
+            return_value=sitemap + ['https://audicare.com.br/contato']
+        )
+        scrapper._discover_pages_common_paths = Mock(return_value=[])
+        scrapper._probe_page_size = Mock(return_value=1000)
+
+        scrapper._discover_pages('https://audicare.com.br')
+
+        probed = [c.args[0] for c in scrapper._probe_page_size.call_args_list]
+        assert len(probed) == website_scrapper.MAX_PROBE_CANDIDATES
+        assert 'https://audicare.com.br/contato' in probed
+
+    def test_discover_pages_ranks_relevant_pages_above_larger_ones(
+        self,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test an on-topic page beats a slightly larger off-topic page."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        scrapper._discover_pages_from_homepage = Mock(
+            return_value=[
+                'https://audicare.com.br/blog-index',
+                'https://audicare.com.br/quem-somos',
+            ]
+        )
+        scrapper._discover_pages_from_sitemap = Mock(return_value=[])
+        scrapper._discover_pages_common_paths = Mock(return_value=[])
+        sizes = {
+            'https://audicare.com.br/blog-index': 12000,
+            'https://audicare.com.br/quem-somos': 9000,
+        }
+        scrapper._probe_page_size = Mock(side_effect=sizes.get)
+
+        pages = scrapper._discover_pages('https://audicare.com.br')
+
+        assert pages[0] == 'https://audicare.com.br/quem-somos'
+
+    def test_parse_sitemap_locs_caps_urls(self, mock_boto3_setup):
+        """Test sitemap parsing stops at SITEMAP_MAX_URLS entries."""
+        content = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + ''.join(
+                f'<url><loc>https://audicare.com.br/p{i}</loc></url>' for i in range(50)
+            )
+            + '</urlset>'
+        ).encode('utf-8')
+
+        with patch('src.models.scrappers.website_scrapper.SITEMAP_MAX_URLS', 10):
+            urls = WebsiteScrapper._parse_sitemap_locs(io.BytesIO(content))
+
+        assert len(urls) == 10
+        assert urls[0] == 'https://audicare.com.br/p0'
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_discover_pages_from_homepage(
         self,
         mock_get,
@@ -387,10 +673,7 @@ class TestPageDiscovery:
         sample_html_homepage,
     ):
         """Test page discovery from homepage navigation."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = sample_html_homepage
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page_response(sample_html_homepage)
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
@@ -404,6 +687,35 @@ class TestPageDiscovery:
         assert any('sobre' in page.lower() for page in pages)
         assert any('contato' in page.lower() for page in pages)
 
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_discover_pages_from_homepage_nav_class(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test links in elements with nav-like classes are discovered."""
+        mock_get.return_value = _page_response(
+            """
+        <html><body>
+            <div class="Main-Menu"><a href="/servicos">Serviços</a></div>
+            <main><a href="/promo-2024">Promoção</a></main>
+        </body></html>
+        """
+        )
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        pages = scrapper._discover_pages_from_homepage('https://audicare.com.br')
+
+        assert pages == ['https://audicare.com.br/servicos']
+
     def test_discover_pages_common_paths(
         self, mock_boto3_setup, mock_settings, mock_db_handler, mock_gemini_handler
     ):
@@ -431,7 +743,7 @@ class TestPageDiscovery:
 class TestHTMLFetching:
     """Tests for HTML content fetching."""
 
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_fetch_page_content_success(
         self,
         mock_get,
@@ -442,10 +754,7 @@ class TestHTMLFetching:
         sample_html_homepage,
     ):
         """Test successful HTML fetch."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = sample_html_homepage
-        mock_get.return_value = mock_response
+        mock_get.return_value = _page_response(sample_html_homepage)
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
@@ -459,7 +768,7 @@ class TestHTMLFetching:
         assert scrapper.ensamble['pages_fetched'] == 1
         assert scrapper.ensamble['pages_failed'] == 0
 
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_fetch_page_content_404(
         self,
         mock_get,
@@ -484,7 +793,7 @@ class TestHTMLFetching:
         assert html is None
         assert scrapper.ensamble['pages_failed'] == 1
 
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_fetch_page_content_timeout(
         self,
         mock_get,
@@ -509,6 +818,264 @@ class TestHTMLFetching:
         assert html is None
         assert scrapper.ensamble['pages_failed'] == 1
 
+    @patch('src.models.scrappers.website_scrapper.time.sleep')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_fetch_all_preserves_order_and_counts(
+        self,
+        mock_get,
+        mock_sleep,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test concurrent fetch returns results in input order."""
+
+        def get_side_effect(url, **kwargs):
+            return _page_response(
+                f'<html>{url}</html>', 404 if url.endswith('/7') else 200
+            )
+
+        mock_get.side_effect = get_side_effect
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        urls = [f'https://audicare.com.br/{i}' for i in range(10)]
+        results = scrapper._fetch_all(urls)
+
+        assert [url for url, _ in results] == urls
+        assert results[7][1] is None
+        assert results[0][1] == '<html>https://audicare.com.br/0</html>'
+        assert scrapper.ensamble['pages_fetched'] == 9
+        assert scrapper.ensamble['pages_failed'] == 1
+
+    def test_fetch_all_isolates_fetcher_errors(
+        self,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test an exception for one URL does not abort the others."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        scrapper._body_cache = {
+            'https://audicare.com.br/a': '<html>a</html>',
+            'https://audicare.com.br/b': '<html>b</html>',
+        }
+
+        def fetcher(url):
+            if url.endswith('/a'):
+                raise RuntimeError('boom')
+            return scrapper._body_cache[url]
+
+        results = scrapper._fetch_all(
+            ['https://audicare.com.br/a', 'https://audicare.com.br/b'],
+            fetcher=fetcher,
+        )
+
+        assert results == [
+            ('https://audicare.com.br/a', None),
+            ('https://audicare.com.br/b', '<html>b</html>'),
+        ]
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.head')
+    def test_probe_page_size_uses_content_length(
+        self,
+        mock_head,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test page size comes from HEAD without downloading the body."""
+        mock_head.return_value = Mock(
+            status_code=200, headers={'Content-Length': '5120'}
+        )
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        size = scrapper._probe_page_size('https://audicare.com.br/sobre')
+
+        assert size == 5120
+        mock_get.assert_not_called()
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.head')
+    def test_probe_page_size_caches_body_without_content_length(
+        self,
+        mock_head,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+        sample_html_about,
+    ):
+        """Test a fallback GET body is reused by the following fetch."""
+        mock_head.return_value = Mock(status_code=200, headers={})
+        mock_get.return_value = _page_response(sample_html_about)
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        size = scrapper._probe_page_size('https://audicare.com.br/sobre')
+        html = scrapper._fetch_page_content('https://audicare.com.br/sobre')
+
+        assert size == len(sample_html_about.encode('utf-8'))
+        assert html == sample_html_about
+        mock_get.assert_called_once()
+
+    @patch('src.models.scrappers.website_scrapper._get_rate_limiter')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.head')
+    def test_probe_page_size_measures_encoded_pages_by_body(
+        self,
+        mock_head,
+        mock_get,
+        mock_get_limiter,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test a gzip Content-Length is ignored and the GET takes a token."""
+        html = '<p>Atendimento em São Paulo</p>'
+        mock_head.return_value = Mock(
+            status_code=200,
+            headers={'Content-Length': '12', 'Content-Encoding': 'gzip'},
+        )
+        mock_get.return_value = _page_response(html)
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        size = scrapper._probe_page_size('https://audicare.com.br/sobre')
+
+        assert size == len(html.encode('utf-8'))
+        limiter = mock_get_limiter.return_value
+        assert limiter.wait_for_token.call_args_list == [
+            call(website_scrapper.PROBE_TOKEN_COST),
+            call(),
+        ]
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
+    def test_fetch_page_content_truncates_large_body(
+        self,
+        mock_get,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+    ):
+        """Test oversized bodies stop being read at the byte cap."""
+        chunk = b'a' * website_scrapper.PAGE_CHUNK_SIZE
+        response = _page_response('')
+        response.iter_content.return_value = iter([chunk] * 100)
+        mock_get.return_value = response
+
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        html = scrapper._fetch_page_content('https://audicare.com.br/catalogo')
+
+        assert len(html) == website_scrapper.PAGE_MAX_BYTES
+        response.close.assert_called_once()
+
+
+# Test link scoring
+class TestScoreUrl:
+    """Tests for the module-level link relevance score."""
+
+    def test_score_counts_each_keyword(self):
+        """Test overlapping keywords each add to the score."""
+        assert website_scrapper.score_url(
+            'https://audicare.com.br/servicos'
+        ) == pytest.approx(2 - 0.1)
+
+    def test_score_unrelated_path_only_depth_penalty(self):
+        """Test paths without keywords only carry the depth penalty."""
+        assert website_scrapper.score_url(
+            'https://audicare.com.br/blog/post'
+        ) == pytest.approx(-0.2)
+
+
+# Test request rate limiting
+class TestRateLimiter:
+    """Tests for the per-host token bucket."""
+
+    @patch('src.models.scrappers.website_scrapper.time.sleep')
+    @patch('src.models.scrappers.website_scrapper.time.monotonic')
+    def test_burst_then_wait(self, mock_monotonic, mock_sleep):
+        """Test requests within the burst do not wait and later ones do."""
+        mock_monotonic.return_value = 100.0
+        limiter = website_scrapper._RateLimiter(rate=2.0, max_tokens=2)
+
+        limiter.wait_for_token()
+        limiter.wait_for_token()
+        mock_sleep.assert_not_called()
+
+        limiter.wait_for_token()
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch('src.models.scrappers.website_scrapper.time.sleep')
+    @patch('src.models.scrappers.website_scrapper.time.monotonic')
+    def test_tokens_refill_over_time(self, mock_monotonic, mock_sleep):
+        """Test tokens accrue with elapsed time up to the bucket size."""
+        mock_monotonic.return_value = 100.0
+        limiter = website_scrapper._RateLimiter(rate=2.0, max_tokens=1)
+        limiter.wait_for_token()
+
+        mock_monotonic.return_value = 101.0
+        limiter.wait_for_token()
+
+        mock_sleep.assert_not_called()
+
+    @patch('src.models.scrappers.website_scrapper.time.sleep')
+    @patch('src.models.scrappers.website_scrapper.time.monotonic')
+    def test_fractional_cost(self, mock_monotonic, mock_sleep):
+        """Test cheaper requests consume proportionally fewer tokens."""
+        mock_monotonic.return_value = 100.0
+        limiter = website_scrapper._RateLimiter(rate=2.0, max_tokens=1)
+
+        for _ in range(4):
+            limiter.wait_for_token(cost=0.25)
+        mock_sleep.assert_not_called()
+
+        limiter.wait_for_token(cost=0.25)
+        mock_sleep.assert_called_once_with(0.125)
+
+    def test_limiter_shared_per_host(self):
+        """Test the same limiter is returned for the same host."""
+        first = website_scrapper._get_rate_limiter('audicare.com.br')
+        second = website_scrapper._get_rate_limiter('audicare.com.br')
+        other = website_scrapper._get_rate_limiter('example.com')
+
+        assert first is second
+        assert other is not first
+
 
 # Test text extraction
 @patch('src.models.scrappers.website_scrapper.boto3.setup_default_session')
@@ -538,6 +1105,50 @@ class TestTextExtraction:
         assert '<html>' not in text  # No HTML tags
         assert '<body>' not in text
 
+    def test_extract_text_cached_for_identical_html(
+        self,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+        sample_html_about,
+    ):
+        """Test identical HTML bodies are only parsed once."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
+        with patch(
+            'src.models.scrappers.website_scrapper.lxml.html.fromstring',
+            wraps=lxml.html.fromstring,
+        ) as mock_fromstring:
+            first = scrapper._extract_text_from_html(sample_html_about)
+            second = scrapper._extract_text_from_html(sample_html_about)
+
+        assert first == second
+        assert mock_fromstring.call_count == 1
+
+    def test_extract_text_xhtml_with_encoding_declaration(
+        self, mock_boto3_setup, mock_settings, mock_db_handler, mock_gemini_handler
+    ):
+        """Test XHTML with an XML encoding declaration still yields text."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        html = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<html><body><p>Aparelhos auditivos</p>'
+            '<script>track()</script></body></html>'
+        )
+
+        text = scrapper._extract_text_from_html(html)
+
+        assert text == 'Aparelhos auditivos'
+
     def test_extract_text_removes_scripts(
         self, mock_boto3_setup, mock_settings, mock_db_handler, mock_gemini_handler
     ):
@@ -573,14 +1184,8 @@ class TestStructuredDataExtraction:
     """Tests for LLM-powered data extraction."""
 
     @patch('src.models.scrappers.website_scrapper.GoogleGeminiHandler')
-    @patch(
-        'builtins.open',
-        new_callable=mock_open,
-        read_data='{"type": "object", "properties": {}}',
-    )
     def test_extract_structured_data_success(
         self,
-        mock_file,
         mock_gemini_class,
         mock_boto3_setup,
         mock_settings,
@@ -589,12 +1194,6 @@ class TestStructuredDataExtraction:
         sample_gemini_response,
     ):
         """Test successful structured data extraction with Gemini."""
-        scrapper = WebsiteScrapper(
-            company_id='test-uuid',
-            website='https://audicare.com.br',
-            gemini_api_key='test-key',
-        )
-
         # Mock Gemini handler to return proper result object
         mock_gemini_instance = MagicMock()
         mock_result = Mock()
@@ -602,6 +1201,12 @@ class TestStructuredDataExtraction:
         mock_gemini_instance.generate_output.return_value = mock_result
         mock_gemini_class.return_value = mock_gemini_instance
 
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+
         pages_content = {'https://audicare.com.br/sobre': sample_html_about}
 
         data = scrapper._extract_structured_data(pages_content)
@@ -611,56 +1216,142 @@ class TestStructuredDataExtraction:
         assert data['addresses'][0]['city'] == 'São Paulo'
         assert len(data['phones']) == 2
         assert data['cnpj'] == '12.345.678/0001-90'
+        mock_gemini_class.assert_called_once_with(
+            api_key='test-key',
+            temperature=0.0,
+            response_mime_type='application/json',
+            response_schema=website_scrapper.RESPONSE_SCHEMA,
+        )
 
-    @patch(
-        'builtins.open',
-        new_callable=mock_open,
-        read_data='{"type": "object", "properties": {}}',
-    )
-    def test_extract_structured_data_no_content(
+    @patch('src.models.scrappers.website_scrapper.GoogleGeminiHandler')
+    def test_extract_structured_data_skips_duplicate_pages(
         self,
-        mock_file,
+        mock_gemini_class,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
-        mock_gemini_handler,
+        sample_gemini_response,
     ):
-        """Test extraction with no page content."""
+        """Test pages differing only by a date are sent to Gemini once."""
+        mock_gemini_instance = MagicMock()
+        mock_result = Mock()
+        mock_result.text = json.dumps(sample_gemini_response)
+        mock_gemini_instance.generate_output.return_value = mock_result
+        mock_gemini_class.return_value = mock_gemini_instance
+
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
             website='https://audicare.com.br',
             gemini_api_key='test-key',
         )
 
-        pages_content = {}
-        data = scrapper._extract_structured_data(pages_content)
+        pages_content = {
+            'https://audicare.com.br/a': '<p>Aparelhos auditivos - 01/02/2024</p>',
+            'https://audicare.com.br/b': '<p>Aparelhos auditivos - 15/03/2025</p>',
+            'https://audicare.com.br/c': '<p>Sobre a Audicare</p>',
+        }
 
-        assert data == {}
+        scrapper._extract_structured_data(pages_content)
+
+        prompt = mock_gemini_instance.generate_output.call_args.kwargs['prompt']
+        assert 'https://audicare.com.br/a' in prompt
+        assert 'https://audicare.com.br/b' not in prompt
+        assert 'https://audicare.com.br/c' in prompt
 
-    @patch('builtins.open', side_effect=FileNotFoundError)
-    def test_extract_structured_data_schema_not_found(
+    def test_extract_structured_data_no_content(
         self,
-        mock_file,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
         mock_gemini_handler,
-        sample_html_about,
     ):
-        """Test extraction handles missing schema file."""
+        """Test extraction with no page content."""
         scrapper = WebsiteScrapper(
             company_id='test-uuid',
             website='https://audicare.com.br',
             gemini_api_key='test-key',
         )
 
-        pages_content = {'https://audicare.com.br/sobre': sample_html_about}
-
+        pages_content = {}
         data = scrapper._extract_structured_data(pages_content)
 
         assert data == {}
 
 
+class TestBoilerplateRemoval:
+    """Tests for repeated boilerplate and duplicate page detection."""
+
+    def test_common_lines_kept_once(self):
+        """Test lines shared by most pages only remain on the first page."""
+        footer = 'Rua das Flores, 123 - São Paulo\n(11) 3333-4444'
+        texts = [
+            f'Início\nBem-vindo à Audicare\n{footer}',
+            f'Início\nQuem somos: fundada em 2010\n{footer}',
+            f'Início\nAparelhos auditivos\n{footer}',
+        ]
+
+        cleaned = WebsiteScrapper._strip_boilerplate(texts)
+
+        assert cleaned[0] == texts[0]
+        assert cleaned[1] == 'Quem somos: fundada em 2010'
+        assert cleaned[2] == 'Aparelhos auditivos'
+
+    def test_consecutive_duplicates_collapsed(self):
+        """Test repeated adjacent lines within a page are collapsed."""
+        cleaned = WebsiteScrapper._strip_boilerplate(['Menu\nMenu\nContato'])
+
+        assert cleaned == ['Menu\nContato']
+
+    def test_single_page_untouched(self):
+        """Test a lone page keeps all of its lines."""
+        assert WebsiteScrapper._strip_boilerplate(['a\nb']) == ['a\nb']
+
+    def test_text_fingerprint_keeps_contact_digits(self):
+        """Test dates and times are ignored but phones and CEPs are not."""
+        fingerprint = WebsiteScrapper._text_fingerprint
+
+        assert fingerprint('Atualizado em 01/02/2024 às 10:30') == fingerprint(
+            'Atualizado em 15/03/2025 às 18:05:12'
+        )
+        assert fingerprint('Unidade Centro\n(11) 3456-7890') != fingerprint(
+            'Unidade Centro\n(11) 3456-7891'
+        )
+        assert fingerprint('CEP 01310-100, nº 1500') != fingerprint(
+            'CEP 04538-133, nº 3477'
+        )
+
+
+class TestTextBudget:
+    """Tests for the prompt character budget allocation."""
+
+    def test_short_pages_kept_whole(self):
+        """Test pages under their share keep their full length."""
+        texts = ['contato telefone', 'sobre nós empresa']
+
+        budgets = WebsiteScrapper._allocate_text_budget(texts, 1000)
+
+        assert budgets == [len(texts[0]), len(texts[1])]
+
+    def test_leftover_redistributed_to_long_pages(self):
+        """Test budget unused by short pages goes to long ones."""
+        short = 'contato'
+        long_varied = ' '.join(f'palavra{i}' for i in range(500))
+        long_repetitive = ' '.join(['menu'] * 1000)
+
+        budgets = WebsiteScrapper._allocate_text_budget(
+            [short, long_varied, long_repetitive], 3000
+        )
+
+        assert budgets[0] == len(short)
+        assert sum(budgets) <= 3000
+        assert sum(budgets) >= 3000 - 2
+        assert budgets[1] > budgets[2]
+
+    def test_empty_input(self):
+        """Test no texts yield no budgets."""
+        assert WebsiteScrapper._allocate_text_budget([], 1000) == []
+
+
 # Test database operations
 @patch('src.models.scrappers.website_scrapper.boto3.setup_default_session')
 class TestDatabaseOperations:
@@ -741,16 +1432,12 @@ class TestCollectDataWorkflow:
 
     @patch('src.models.scrappers.website_scrapper.GoogleGeminiHandler')
     @patch('src.models.scrappers.website_scrapper.time.sleep')
-    @patch('src.models.scrappers.website_scrapper.requests.get')
-    @patch(
-        'builtins.open',
-        new_callable=mock_open,
-        read_data='{"type": "object", "properties": {}}',
-    )
+    @patch('src.models.scrappers.website_scrapper.requests.Session.head')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_collect_data_full_workflow(
         self,
-        mock_file,
         mock_get,
+        mock_head,
         mock_sleep,
         mock_gemini_class,
         mock_boto3_setup,
@@ -764,17 +1451,15 @@ class TestCollectDataWorkflow:
         # Mock robots.txt (allow)
         # Mock page fetching
         def get_side_effect(url, **kwargs):
-            response = Mock()
-            response.status_code = 200
             if 'robots.txt' in url:
-                response.text = 'User-agent: *\nAllow: /'
+                return _page_response('User-agent: *\nAllow: /')
             elif 'sobre' in url:
-                response.text = sample_html_about
+                return _page_response(sample_html_about)
             else:
-                response.text = sample_html_homepage
-            return response
+                return _page_response(sample_html_homepage)
 
         mock_get.side_effect = get_side_effect
+        mock_head.return_value = Mock(status_code=405, headers={})
 
         # Mock Gemini handler to return proper result object
         mock_gemini_instance = MagicMock()
@@ -796,19 +1481,58 @@ class TestCollectDataWorkflow:
         assert scrapper.ensamble['pages_fetched'] > 0
         mock_db_handler.update_item.assert_called()
 
-    @patch('src.models.scrappers.website_scrapper.RobotFileParser')
+        # Pages downloaded during discovery are not downloaded again
+        fetched_urls = [call.args[0] for call in mock_get.call_args_list]
+        assert len(fetched_urls) == len(set(fetched_urls))
+
+    @patch('src.shared.utils.validate_cnpj', return_value=True)
+    def test_collect_data_queues_federal_scraping(
+        self,
+        mock_validate,
+        mock_boto3_setup,
+        mock_settings,
+        mock_db_handler,
+        mock_gemini_handler,
+        sample_html_about,
+    ):
+        """Test a valid CNPJ is queued and the task finishes before close returns."""
+        scrapper = WebsiteScrapper(
+            company_id='test-uuid-123',
+            website='https://audicare.com.br',
+            gemini_api_key='test-key',
+        )
+        url = 'https://audicare.com.br/sobre'
+
+        with patch.object(
+            scrapper, '_check_robots_txt', return_value=True
+        ), patch.object(scrapper, '_discover_pages', return_value=[url]), patch.object(
+            scrapper, '_fetch_all', return_value=[(url, sample_html_about)]
+        ), patch.object(
+            scrapper,
+            '_extract_structured_data',
+            return_value={'cnpj': '12.345.678/0001-90'},
+        ), patch.object(
+            scrapper, '_queue_federal_scraping_task'
+        ) as mock_queue:
+            scrapper.collect_data()
+
+        mock_queue.assert_called_once_with('test-uuid-123', '12345678000190')
+        mock_db_handler.update_item.assert_called()
+
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_collect_data_robots_txt_disallowed(
         self,
-        mock_robot_parser_class,
+        mock_get,
         mock_boto3_setup,
         mock_settings,
         mock_db_handler,
         mock_gemini_handler,
     ):
         """Test workflow respects robots.txt disallow."""
-        mock_rp = Mock()
-        mock_rp.can_fetch.return_value = False
-        mock_robot_parser_class.return_value = mock_rp
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = 'User-agent: *\nDisallow: /'
+        mock_get.return_value = mock_response
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid-123',
@@ -840,10 +1564,12 @@ class TestCollectDataWorkflow:
         mock_db_handler.update_item.assert_called()
 
     @patch('src.models.scrappers.website_scrapper.time.sleep')
-    @patch('src.models.scrappers.website_scrapper.requests.get')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.head')
+    @patch('src.models.scrappers.website_scrapper.requests.Session.get')
     def test_collect_data_no_pages_fetched(
         self,
         mock_get,
+        mock_head,
         mock_sleep,
         mock_boto3_setup,
         mock_settings,
@@ -854,6 +1580,7 @@ class TestCollectDataWorkflow:
         mock_response = Mock()
         mock_response.status_code = 500
         mock_get.return_value = mock_response
+        mock_head.return_value = mock_response
 
         scrapper = WebsiteScrapper(
             company_id='test-uuid-123',